@@ -219,6 +219,16 @@ def _json_safe(value: Any) -> Any:
     return value
 
 
+@functools.lru_cache(maxsize=256)
+def _type_adapter(return_type: Any) -> TypeAdapter[Any]:
+    """Return a process-wide ``TypeAdapter`` for *return_type*.
+
+    Memoized so repeated cache hits reuse one compiled validator instead of
+    building a fresh adapter per rehydration.
+    """
+    return TypeAdapter(return_type)
+
+
 def _reconstruct_from_cache(cached_value: Any, return_type: Any) -> Any:
     """Rehydrate a cache HIT back into *return_type* when needed.
 
@@ -239,7 +249,7 @@ def _reconstruct_from_cache(cached_value: Any, return_type: Any) -> Any:
             if isinstance(cached_value, return_type):
                 return cached_value
             if isinstance(cached_value, dict):
-                return TypeAdapter(return_type).validate_python(cached_value)
+                return _type_adapter(return_type).validate_python(cached_value)
             return cached_value
         # Non-BaseModel return annotations (primitives, dict[...], list[...],
         # generics, etc.) round trip through JSON without needing
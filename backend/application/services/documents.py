@@ -149,7 +149,7 @@ def _map_document_row_to_model(
         "contextFiles": _string_list(fm.get("contextFiles")),
         "integritySignalRefs": _string_list(fm.get("integritySignalRefs")),
         "fieldKeys": _string_list(fm.get("fieldKeys")),
-        "raw": fm.get("raw") if isinstance(fm.get("raw"), dict) else fm,
+        "raw": (fm.get("raw") if isinstance(fm.get("raw"), dict) else fm) if include_content else None,
     }
 
     raw_status_normalized = str(row.get("status_normalized") or row.get("status") or "")
@@ -299,13 +299,13 @@ class DocumentQueryService:
     ) -> PaginatedResponse[PlanDocument]:
         project = resolve_project(context, ports)
         if project is None:
-            return PaginatedResponse(items=[], total=0, offset=offset, limit=limit)
+            return PaginatedResponse[PlanDocument](items=[], total=0, offset=offset, limit=limit)
 
         repo = ports.storage.documents()
         rows = await repo.list_paginated(project.id, offset, limit, filters)
         total = await repo.count(project.id, filters)
         items = [_map_document_row_to_model(row, include_content=False) for row in rows]
-        return PaginatedResponse(items=items, total=total, offset=offset, limit=limit)
+        return PaginatedResponse[PlanDocument](items=items, total=total, offset=offset, limit=limit)
 
     async def get_catalog(
         self,
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import json
 import logging
+import sys
 
 import backend.config as config
 from backend.application.context import RequestContext
@@ -19,6 +20,12 @@ from backend.application.services.common import resolve_project
 logger = logging.getLogger("ccdash.services.sessions")
 
 
+def _intern_label(value: object) -> str:
+    # speaker/type come from a handful of values but every DB row yields a
+    # fresh str; interning lets long transcripts share one object per label.
+    return sys.intern(str(value or ""))
+
+
 class SessionFacetService:
     async def get_model_facets(
         self,
@@ -151,8 +158,8 @@ class SessionTranscriptService:
         return {
             "id": row.get("source_log_id") or f"log-{row.get('log_index', 0)}",
             "timestamp": row.get("timestamp", ""),
-            "speaker": row.get("speaker", ""),
-            "type": row.get("type", ""),
+            "speaker": _intern_label(row.get("speaker")),
+            "type": _intern_label(row.get("type")),
             "content": row.get("content", ""),
             "agentName": row.get("agent_name"),
             "linkedSessionId": row.get("linked_session_id"),
@@ -207,8 +214,8 @@ class SessionTranscriptService:
         return {
             "id": row.get("source_log_id") or f"log-{row.get('message_index', 0)}",
             "timestamp": row.get("event_timestamp", ""),
-            "speaker": compatibility_speaker_from_role(row.get("role")),
-            "type": row.get("message_type", ""),
+            "speaker": _intern_label(compatibility_speaker_from_role(row.get("role"))),
+            "type": _intern_label(row.get("message_type")),
             "content": row.get("content", ""),
             "agentName": row.get("agent_name"),
             "linkedSessionId": row.get("linked_session_id"),
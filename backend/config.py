@@ -67,7 +67,34 @@ PROJECTS_FILE: Path = Path(_projects_file_env) if _projects_file_env else PROJEC
 OTEL_ENABLED = _env_bool("CCDASH_OTEL_ENABLED", False)
 OTEL_ENDPOINT = os.getenv("CCDASH_OTEL_ENDPOINT", "http://localhost:4318")
 OTEL_SERVICE_NAME = os.getenv("CCDASH_OTEL_SERVICE_NAME", "ccdash-backend")
+# "http/protobuf" (default) or "grpc". gRPC keeps one channel open across exports
+# and needs opentelemetry-exporter-otlp-proto-grpc installed.
+OTEL_PROTOCOL = os.getenv("CCDASH_OTEL_PROTOCOL", "http/protobuf").strip().lower()
 PROM_PORT = _env_int("CCDASH_PROM_PORT", 9464)
+# Distinct project label values kept per Prometheus process; later projects are
+# reported as "other" so child series stay bounded.
+PROM_MAX_PROJECTS = _env_int("CCDASH_PROM_MAX_PROJECTS", 256)
+# Serve Prometheus metrics from the API app at this path (e.g. "/metrics").
+# Pair with CCDASH_PROM_PORT=0 to drop the standalone metrics server.
+PROM_MOUNT_PATH = os.getenv("CCDASH_PROM_MOUNT_PATH", "").strip().rstrip("/")
+# BatchSpanProcessor sizing. Defaults favour bursty sync/ingest traffic over the
+# SDK's 2048-span queue and 5s flush delay.
+OTEL_BSP_MAX_QUEUE_SIZE = _env_int("CCDASH_OTEL_BSP_MAX_QUEUE_SIZE", 4096)
+OTEL_BSP_SCHEDULE_DELAY_MS = _env_int("CCDASH_OTEL_BSP_SCHEDULE_DELAY_MS", 1000)
+OTEL_BSP_MAX_EXPORT_BATCH_SIZE = _env_int("CCDASH_OTEL_BSP_MAX_EXPORT_BATCH_SIZE", 256)
+OTEL_BSP_EXPORT_TIMEOUT_MS = _env_int("CCDASH_OTEL_BSP_EXPORT_TIMEOUT_MS", 10000)
+# Span export circuit breaker: after N consecutive failed exports, drop batches
+# for the cooldown instead of retrying against an unreachable collector.
+OTEL_EXPORT_BREAKER_THRESHOLD = _env_int("CCDASH_OTEL_EXPORT_BREAKER_THRESHOLD", 5)
+OTEL_EXPORT_BREAKER_COOLDOWN_S = _env_int("CCDASH_OTEL_EXPORT_BREAKER_COOLDOWN_S", 30)
+# PeriodicExportingMetricReader cadence. A shorter interval than the SDK's 60s
+# keeps fewer accumulated points alive between collections.
+OTEL_METRIC_EXPORT_INTERVAL_MS = _env_int("CCDASH_OTEL_METRIC_EXPORT_INTERVAL_MS", 15000)
+OTEL_METRIC_EXPORT_TIMEOUT_MS = _env_int("CCDASH_OTEL_METRIC_EXPORT_TIMEOUT_MS", 5000)
+# Queue ingestion/tool/token metric updates and apply them from a background task
+# so request and sync paths only pay for a deque append.
+OTEL_DEFERRED_RECORDING = _env_bool("CCDASH_OTEL_DEFERRED_RECORDING", False)
+OTEL_RECORD_QUEUE_SIZE = _env_int("CCDASH_OTEL_RECORD_QUEUE_SIZE", 65536)
 # CCDASH_LOG_LEVEL — root logger level for ``backend/runtime/container.py``'s
 # ``_configure_root_logging``. Without a root handler, records below WARNING
 # never reach any output (Python's ``lastResort`` handler is WARNING-level
@@ -1,6 +1,7 @@
 """Shared date normalization and confidence helpers."""
 from __future__ import annotations
 
+import os
 import re
 from datetime import date, datetime, timezone
 from pathlib import Path
@@ -90,12 +91,18 @@ def _file_created_datetime(stats: Any) -> datetime | None:
     return None
 
 
-def file_metadata_dates(path: Path) -> dict[str, str]:
-    """Return normalized filesystem creation/modified timestamps."""
-    try:
-        stats = path.stat()
-    except Exception:
-        return {"createdAt": "", "updatedAt": ""}
+def file_metadata_dates(path: Path, stat_result: os.stat_result | None = None) -> dict[str, str]:
+    """Return normalized filesystem creation/modified timestamps.
+
+    Pass ``stat_result`` to reuse a stat already taken (e.g. by ``os.scandir``).
+    """
+    if stat_result is not None:
+        stats = stat_result
+    else:
+        try:
+            stats = path.stat()
+        except Exception:
+            return {"createdAt": "", "updatedAt": ""}
 
     created_dt = _file_created_datetime(stats)
     modified_dt = datetime.fromtimestamp(float(stats.st_mtime), timezone.utc)
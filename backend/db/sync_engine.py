@@ -24,6 +24,11 @@ from typing import Any, Literal
 import aiosqlite
 import yaml
 
+try:  # libyaml-backed loader is several times faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 from backend import config, observability
 from backend.observability import otel
 from backend.models import Project
@@ -188,6 +193,7 @@ _PULL_REQUEST_RE = re.compile(r"(?:/pull/|/pulls/|#)(\d+)")
 _COMMIT_HASH_RE = re.compile(r"\b[0-9a-f]{7,40}\b", re.IGNORECASE)
 _TASK_ID_TOKEN_RE = re.compile(r"\b([A-Za-z]+(?:-[A-Za-z0-9]+)*-\d+(?:\.\d+)?)\b")
 _PHASE_TOKEN_RE = re.compile(r"\bphase[\s:_-]*(\d+)\b", re.IGNORECASE)
+_CATALOG_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---", re.DOTALL)
 _WORKING_TREE_COMMIT_HASH = "__working_tree__"
 
 
@@ -5206,9 +5212,8 @@ class SyncEngine:
         git_date_index, dirty_paths = self._build_git_doc_dates(project_root, roots)
 
         for root in roots:
-            for md_file in sorted(self._rglob(root, "*.md")):
-                if md_file.name.startswith("."):
-                    continue
+            visible = [p for p in self._rglob(root, "*.md") if not p.name.startswith(".")]
+            for md_file in sorted(visible):
                 synced = await self._sync_single_document(
                     project_id,
                     md_file,
@@ -5317,9 +5322,8 @@ class SyncEngine:
         if skipped:
             return stats
 
-        for md_file in sorted(self._rglob(progress_dir, "*progress*.md")):
-            if md_file.name.startswith("."):
-                continue
+        visible = [p for p in self._rglob(progress_dir, "*progress*.md") if not p.name.startswith(".")]
+        for md_file in sorted(visible):
             synced = await self._sync_single_progress(project_id, md_file, progress_dir, force)
             if synced:
                 stats["synced"] += 1
@@ -5768,11 +5772,13 @@ class SyncEngine:
             return "Session", "feature-fallback", 0.35
 
         def _extract_frontmatter(text: str) -> dict[str, Any]:
-            match = re.match(r"^---\s*\n(.*?)\n---", text, re.DOTALL)
+            if not text.startswith("---"):
+                return {}
+            match = _CATALOG_FRONTMATTER_RE.match(text)
             if not match:
                 return {}
             try:
-                parsed = yaml.safe_load(match.group(1)) or {}
+                parsed = yaml.load(match.group(1), Loader=_YamlLoader) or {}
             except Exception:
                 parsed = {}
             return parsed if isinstance(parsed, dict) else {}
@@ -5789,9 +5795,8 @@ class SyncEngine:
             for root in (docs_dir, progress_dir):
                 if not root.exists():
                     continue
-                for path in sorted(self._rglob(root, "*.md")):
-                    if path.name.startswith("."):
-                        continue
+                visible = [p for p in self._rglob(root, "*.md") if not p.name.startswith(".")]
+                for path in sorted(visible):
                     try:
                         text = path.read_text(encoding="utf-8")
                     except Exception:
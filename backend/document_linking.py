@@ -6,6 +6,7 @@ use consistent matching semantics.
 """
 from __future__ import annotations
 
+import functools
 import os
 import re
 from pathlib import Path
@@ -13,6 +14,7 @@ from typing import Any
 
 
 _VERSION_SUFFIX_PATTERN = re.compile(r"-v\d+(?:\.\d+)?$", re.IGNORECASE)
+_DOC_ID_SEPARATORS = str.maketrans("/\\", "--")
 _NOISY_PATH_PATTERN = re.compile(r"(\*|\$\{[^}]+\}|<[^>]+>|\{[^{}]+\})")
 _GENERIC_PHASE_PROGRESS_PATTERN = re.compile(r"^phase-[a-z0-9._&-]+-progress$", re.IGNORECASE)
 _FEATURE_TOKEN_PATTERN = re.compile(r"^[a-z0-9][a-z0-9._-]{2,}$", re.IGNORECASE)
@@ -455,6 +457,7 @@ def _unique(values: list[str]) -> list[str]:
     return ordered
 
 
+@functools.lru_cache(maxsize=4096)
 def canonical_slug(slug: str) -> str:
     normalized = (slug or "").strip().lower()
     if not normalized:
@@ -517,7 +520,8 @@ def canonical_project_path(path_value: Path | str, project_root: Path) -> str:
 
 def make_document_id(path_value: str) -> str:
     normalized = normalize_ref_path(path_value)
-    token = (normalized or path_value).replace("/", "-").replace("\\", "-").replace(".md", "")
+    # Every ".md" is dropped, not just the suffix, to keep existing document ids stable.
+    token = (normalized or path_value).translate(_DOC_ID_SEPARATORS).replace(".md", "")
     return f"DOC-{token}"
 
 
@@ -548,6 +552,7 @@ def is_generic_alias_token(token: str) -> bool:
     return False
 
 
+@functools.lru_cache(maxsize=4096)
 def is_feature_like_token(token: str) -> bool:
     value = (token or "").strip().lower()
     if not value:
@@ -598,6 +603,7 @@ def _is_path_like(value: str) -> bool:
     return has_extension or has_doc_marker
 
 
+@functools.lru_cache(maxsize=4096)
 def feature_slug_from_path(path_value: str) -> str:
     normalized = normalize_ref_path(path_value)
     if not normalized:
@@ -835,6 +841,7 @@ def classify_doc_type(path_value: str, frontmatter: dict[str, Any] | None = None
     return "document"
 
 
+@functools.lru_cache(maxsize=4096)
 def detect_root_kind(path_value: str) -> str:
     normalized = normalize_ref_path(path_value).lower()
     if not normalized:
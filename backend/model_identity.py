@@ -1,4 +1,8 @@
-"""Model identity parsing utilities for session display/filtering."""
+"""Model identity parsing utilities for session display/filtering.
+
+This module is self-contained (stdlib only, fully annotated) so it can be
+compiled with mypyc via ``CCDASH_MYPYC=1 pip install --no-build-isolation -e .``; see ``setup.py``.
+"""
 from __future__ import annotations
 
 import re
@@ -7,6 +11,10 @@ from typing import Any
 
 _VERSION_TOKEN_PATTERN = re.compile(r"^\d+$")
 _DATE_SUFFIX_PATTERN = re.compile(r"(?:-\d{8}|-\d{4}-\d{2}-\d{2})+$")
+_IDENTITY_SPLIT_PATTERN = re.compile(r"[-_\s]+")
+_CANONICAL_SEPARATOR_PATTERN = re.compile(r"[\s_]+")
+_REPEATED_DASH_PATTERN = re.compile(r"-{2,}")
+_FILTER_SPLIT_PATTERN = re.compile(r"[\s/_-]+")
 
 
 def _title_case(value: str) -> str:
@@ -38,7 +46,7 @@ def derive_model_identity(raw_model: str | None) -> dict[str, str]:
         }
 
     normalized = raw.lower()
-    parts = [part for part in re.split(r"[-_\s]+", normalized) if part]
+    parts = [part for part in _IDENTITY_SPLIT_PATTERN.split(normalized) if part]
     provider_token = parts[0] if parts else ""
     provider = _provider_label(provider_token)
 
@@ -91,8 +99,8 @@ def canonical_model_name(raw_model: str | None) -> str:
     raw = (raw_model or "").strip().lower()
     if not raw:
         return ""
-    normalized = re.sub(r"[\s_]+", "-", raw)
-    normalized = re.sub(r"-{2,}", "-", normalized).strip("-")
+    normalized = _CANONICAL_SEPARATOR_PATTERN.sub("-", raw)
+    normalized = _REPEATED_DASH_PATTERN.sub("-", normalized).strip("-")
     stripped = _DATE_SUFFIX_PATTERN.sub("", normalized).strip("-")
     return stripped or normalized
 
@@ -144,7 +152,7 @@ def _provider_vendor(raw_model: str | None) -> str:
     raw = (raw_model or "").strip().lower()
     if not raw:
         return "Unknown"
-    parts = [part for part in re.split(r"[-_\s]+", raw) if part]
+    parts = [part for part in _IDENTITY_SPLIT_PATTERN.split(raw) if part]
     token = parts[0] if parts else ""
     return _PROVIDER_VENDOR_TOKENS.get(token, "Unknown")
 
@@ -270,7 +278,7 @@ def model_filter_tokens(value: str | None) -> list[str]:
     if not raw:
         return []
 
-    pieces = [piece.strip() for piece in re.split(r"[\s/_-]+", raw) if piece.strip()]
+    pieces = [piece.strip() for piece in _FILTER_SPLIT_PATTERN.split(raw) if piece.strip()]
     tokens: list[str] = []
     for piece in pieces:
         normalized = piece.replace(".", "-").strip("-")
@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Mapping
 from datetime import datetime, timezone
 from typing import Any, Generic, Literal, Optional, TypeVar
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator, model_validator
+from typing_extensions import Self, TypedDict
 
 T = TypeVar("T")
 
@@ -1293,7 +1295,13 @@ class DocumentFrontmatter(BaseModel):
     contextFiles: list[str] = Field(default_factory=list)
     integritySignalRefs: list[str] = Field(default_factory=list)
     fieldKeys: list[str] = Field(default_factory=list)
-    raw: dict[str, Any] = Field(default_factory=dict)
+    # Full frontmatter mapping. Populated at parse time and on single-document
+    # reads; list responses leave it unset to keep payloads small.
+    raw: Optional[dict[str, Any]] = Field(default=None, repr=False)
+
+    def raw_fields(self) -> dict[str, Any]:
+        """Return the raw frontmatter mapping, or an empty dict when not loaded."""
+        return self.raw or {}
 
 
 class DocumentTaskCounts(BaseModel):
@@ -1441,8 +1449,12 @@ class ProjectTask(BaseModel):
 
 
 # ── Analytics models ───────────────────────────────────────────────
+# Rarely-hit DTOs below opt into ``defer_build`` so their core schema is only
+# compiled on first validate/serialize instead of at ``import backend.models``.
 
 class AnalyticsMetric(BaseModel):
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     name: str
     value: float
     unit: str = ""
@@ -1450,6 +1462,8 @@ class AnalyticsMetric(BaseModel):
 
 
 class AlertConfig(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     id: str
     name: str
     metric: str = "total_tokens"  # 'total_tokens' | 'avg_quality' | 'cost_threshold'
@@ -1460,6 +1474,8 @@ class AlertConfig(BaseModel):
 
 
 class Notification(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     id: str
     alertId: str = ""
     message: str
@@ -2334,6 +2350,8 @@ class FeatureExecutionWarning(BaseModel):
 
 
 class FeatureExecutionAnalyticsSummary(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     sessionCount: int = 0
     primarySessionCount: int = 0
     totalSessionCost: float = 0.0
@@ -3249,7 +3267,18 @@ class LaunchCapabilitiesDTO(BaseModel):
 
 # ── Test Visualizer DTOs ───────────────────────────────────────────
 
-class TestRunDTO(BaseModel):
+class _StorageRowDTO(BaseModel):
+    @classmethod
+    def from_row(cls, values: Mapping[str, Any]) -> Self:
+        """Build from values already coerced by a storage mapper.
+
+        Skips validation; callers must pass field-typed values. Untrusted
+        payloads (e.g. ``IngestRunRequest``) still go through the constructor.
+        """
+        return cls.model_construct(**values)
+
+
+class TestRunDTO(_StorageRowDTO):
     run_id: str
     project_id: str
     timestamp: str
@@ -3268,7 +3297,7 @@ class TestRunDTO(BaseModel):
     created_at: str = ""
 
 
-class TestDefinitionDTO(BaseModel):
+class TestDefinitionDTO(_StorageRowDTO):
     test_id: str
     project_id: str
     path: str
@@ -3280,20 +3309,22 @@ class TestDefinitionDTO(BaseModel):
     updated_at: str = ""
 
 
-class TestResultDTO(BaseModel):
+class TestResultDTO(_StorageRowDTO):
     run_id: str
     test_id: str
     status: str
     duration_ms: int = 0
     error_fingerprint: str = ""
     error_message: str = ""
-    artifact_refs: list[str] = Field(default_factory=list)
+    artifact_refs: tuple[str, ...] = ()
     stdout_ref: str = ""
     stderr_ref: str = ""
     created_at: str = ""
 
 
 class TestDomainDTO(BaseModel):
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     domain_id: str
     project_id: str
     name: str
@@ -3306,6 +3337,8 @@ class TestDomainDTO(BaseModel):
 
 
 class TestFeatureMappingDTO(BaseModel):
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     mapping_id: int
     project_id: str
     test_id: str
@@ -3320,6 +3353,20 @@ class TestFeatureMappingDTO(BaseModel):
     created_at: str = ""
 
 
+class IntegritySignalDetails(TypedDict, total=False):
+    """Evidence attached by ``IntegrityDetector``; one key per signal type.
+
+    Static typing aid for the detector only. ``TestIntegritySignalDTO.details``
+    stays an open dict so stored rows with other keys or shapes round-trip intact.
+    """
+
+    removed_assertions: list[str]
+    added_skip_lines: list[str]
+    added_xfail_lines: list[str]
+    broad_exception_context: list[str]
+    reason: str
+
+
 class TestIntegritySignalDTO(BaseModel):
     signal_id: str
     project_id: str
@@ -3371,14 +3418,14 @@ class CursorPaginatedResponse(BaseModel, Generic[T]):
     next_cursor: Optional[str] = None
 
 
-class TestResultHistoryDTO(BaseModel):
+class TestResultHistoryDTO(_StorageRowDTO):
     run_id: str
     test_id: str
     status: str
     duration_ms: int = 0
     error_fingerprint: str = ""
     error_message: str = ""
-    artifact_refs: list[str] = Field(default_factory=list)
+    artifact_refs: tuple[str, ...] = ()
     stdout_ref: str = ""
     stderr_ref: str = ""
     created_at: str = ""
@@ -3403,6 +3450,8 @@ class RunResultPageDTO(BaseModel):
 
 
 class FeatureTimelinePointDTO(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     date: str
     pass_rate: float = 0.0
     passed: int = 0
@@ -3413,6 +3462,8 @@ class FeatureTimelinePointDTO(BaseModel):
 
 
 class FeatureTimelineResponseDTO(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     feature_id: str
     feature_name: str = ""
     timeline: list[FeatureTimelinePointDTO] = Field(default_factory=list)
@@ -3463,6 +3514,8 @@ class EffectiveTestFlagsDTO(BaseModel):
 
 
 class TestSourceStatusDTO(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     platformId: str
     enabled: bool = False
     watch: bool = False
@@ -3545,6 +3598,8 @@ class MappingResolverDetailResponseDTO(BaseModel):
 
 
 class TestMetricSummaryDTO(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     project_id: str
     total_metrics: int = 0
     by_platform: dict[str, int] = Field(default_factory=dict)
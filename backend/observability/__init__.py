@@ -1,15 +1,26 @@
-"""Observability helpers."""
+"""Observability helpers.
 
-from backend.observability.otel import (
-    initialize,
-    shutdown,
-    start_span,
-    record_ingestion,
-    record_parser_failure,
-    record_tool_result,
-    record_token_cost,
-    record_link_rebuild_scope,
-)
+The helpers below are re-exported lazily (PEP 562) so that importing a
+sibling module such as ``backend.observability.feature_surface`` does not
+pull in ``otel`` and its FastAPI dependency until a helper is first used.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from backend.observability.otel import (
+        initialize,
+        shutdown,
+        start_span,
+        record_ingestion,
+        record_parser_failure,
+        record_tool_result,
+        record_token_cost,
+        record_link_rebuild_scope,
+    )
 
 __all__ = [
     "initialize",
@@ -21,3 +32,11 @@ __all__ = [
     "record_token_cost",
     "record_link_rebuild_scope",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module("backend.observability.otel"), name)
+    globals()[name] = value
+    return value
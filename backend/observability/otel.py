@@ -1,18 +1,23 @@
 """OpenTelemetry + Prometheus fallback wiring for CCDash backend."""
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import os
+import re
 import socket
+import sys
 import time
-from contextlib import contextmanager
-from typing import Any, Mapping
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Mapping
 from uuid import uuid4
 
-from fastapi import FastAPI
-
 from backend import config
 
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
 logger = logging.getLogger("ccdash.observability")
 
 
@@ -112,6 +117,7 @@ _link_rebuild_commit_counter: Any | None = None
 _prom_link_rebuild_commit_counter: Any | None = None
 
 _prom_enabled = False
+_prom_registry: Any | None = None
 _prom_ingestion_counter: Any | None = None
 _prom_ingestion_latency_hist: Any | None = None
 _prom_parser_failure_counter: Any | None = None
@@ -149,30 +155,219 @@ _reconcile_heartbeat_counter: Any | None = None
 _prom_reconcile_heartbeat_counter: Any | None = None
 
 _RUNTIME_PROM_LABEL_NAMES = ("runtime_profile", "deployment_mode", "storage_profile")
+
+# (attr suffix, kind, metric name, description, label names) for
+# each ``_prom_*`` global; registered in one pass by ``initialize()``.
+_PROM_SPECS: tuple[tuple[str, str, str, str, tuple[str, ...]], ...] = (
+    ("ingestion_counter", "counter", "ccdash_ingestion_events_total",
+     "Count of telemetry ingestion operations",
+     ("entity", "result", "project", "source")),
+    ("ingestion_latency_hist", "histogram", "ccdash_ingestion_latency_ms",
+     "Latency for parser and sync ingestion operations",
+     ("entity", "result", "project", "source")),
+    ("parser_failure_counter", "counter", "ccdash_parser_failures_total",
+     "Count of parser failures",
+     ("parser", "project")),
+    ("tool_calls_counter", "counter", "ccdash_tool_calls_total",
+     "Tool call outcomes observed while ingesting sessions",
+     ("tool", "status", "project")),
+    ("tool_duration_hist", "histogram", "ccdash_tool_duration_ms",
+     "Observed tool execution durations",
+     ("tool", "project")),
+    ("tokens_counter", "counter", "ccdash_tokens_total",
+     "Token totals by model and feature context",
+     ("model", "feature", "direction", "project")),
+    ("cost_counter", "counter", "ccdash_cost_usd_total",
+     "Cost totals by model and feature context",
+     ("model", "feature", "project")),
+    ("telemetry_export_events_counter", "counter", "ccdash_telemetry_export_events_total",
+     "Count of telemetry exporter batch outcomes",
+     ("status", "project", *_RUNTIME_PROM_LABEL_NAMES)),
+    ("telemetry_export_latency_hist", "histogram", "ccdash_telemetry_export_latency_ms",
+     "Latency for telemetry export batches",
+     ("project", *_RUNTIME_PROM_LABEL_NAMES)),
+    ("telemetry_export_queue_depth_gauge", "gauge", "ccdash_telemetry_export_queue_depth",
+     "Telemetry export queue depth by status and project",
+     ("status", "project", *_RUNTIME_PROM_LABEL_NAMES)),
+    ("telemetry_export_errors_counter", "counter", "ccdash_telemetry_export_errors_total",
+     "Telemetry export errors by class",
+     ("error_type", "project", *_RUNTIME_PROM_LABEL_NAMES)),
+    ("telemetry_export_disabled_gauge", "gauge", "ccdash_telemetry_export_disabled",
+     "Whether telemetry export is disabled",
+     ()),
+    ("worker_job_freshness_gauge", "gauge", "ccdash_worker_job_freshness_ms",
+     "Age since the last successful worker job execution by job and runtime metadata",
+     ("job", "project", *_RUNTIME_PROM_LABEL_NAMES)),
+    ("worker_job_backpressure_gauge", "gauge", "ccdash_worker_job_backpressure_ratio",
+     "Worker job backlog pressure ratio by job and runtime metadata",
+     ("job", "project", *_RUNTIME_PROM_LABEL_NAMES)),
+    ("auth_login_failures_counter", "counter", "ccdash_auth_login_failures_total",
+     "Hosted auth login and callback failures by provider and phase",
+     ("provider", "phase", "status", "reason", "runtime_profile")),
+    ("auth_session_errors_counter", "counter", "ccdash_auth_session_errors_total",
+     "Request/session authentication errors by provider",
+     ("provider", "status", "reason", "runtime_profile")),
+    ("auth_authorization_decisions_counter", "counter", "ccdash_auth_authorization_decisions_total",
+     "Authorization decisions observed through the HTTP authorization seam",
+     ("action", "resource_type", "decision", "status", "provider", "runtime_profile")),
+    ("auth_issuer_health_counter", "counter", "ccdash_auth_issuer_health_total",
+     "OIDC/hosted issuer health observations from auth flow seams",
+     ("provider", "issuer", "status", "runtime_profile")),
+    ("db_write_failures_counter", "counter", "ccdash_db_write_failures_total",
+     "DB write failures (e.g. locked retries exhausted) by repo and reason",
+     ("repo", "reason")),
+    ("feature_surface_requests_counter", "counter", "ccdash_feature_surface_requests_total",
+     "Feature-surface endpoint request count",
+     ("endpoint", "filter_kind", "result_count_bucket", "payload_bytes_bucket")),
+    ("feature_surface_latency_hist", "histogram", "ccdash_feature_surface_latency_ms",
+     "Feature-surface endpoint latency in milliseconds",
+     ("endpoint", "filter_kind")),
+    # ── Runtime-performance-hardening metrics (OBS-401) ───────────────
+    ("frontend_poll_teardown_counter", "counter", "ccdash_frontend_poll_teardown_total",
+     "Frontend polling teardown events triggered after sustained unreachability.",
+     ()),
+    ("link_rebuild_scope_counter", "counter", "ccdash_link_rebuild_scope",
+     "Link rebuild dispatches by resolved scope.",
+     ("scope",)),
+    ("filesystem_scan_cached_counter", "counter", "ccdash_filesystem_scan_cached_total",
+     "Filesystem scan invocations skipped via light-mode manifest cache.",
+     ()),
+    ("workflow_detail_batch_rows_hist", "histogram", "ccdash_workflow_detail_batch_rows",
+     "Workflow-detail batch query row counts.",
+     ("endpoint",)),
+    # ── Live-fanout + watcher metrics (FU-5) ─────────────────────────
+    ("live_fanout_publish_latency_hist", "histogram", "ccdash_live_fanout_publish_latency_ms",
+     "Latency of cross-process live fanout publish operations.",
+     ("scope",)),
+    ("live_fanout_delivered_counter", "counter", "ccdash_live_fanout_delivered_total",
+     "Cross-process live fanout publish outcomes by result.",
+     ("result",)),
+    ("live_fanout_listener_received_counter", "counter", "ccdash_live_fanout_listener_received_total",
+     "Postgres NOTIFY envelopes received and processed by the API listener.",
+     ("result",)),
+    ("watcher_sync_latency_hist", "histogram", "ccdash_watcher_sync_latency_ms",
+     "Latency of file-watcher-triggered sync_changed_files calls.",
+     ()),
+    # ── Phase-6 Wave-A: new Prometheus mirrors ────────────────────────
+    # 1. analytics-snapshot
+    ("analytics_snapshot_latency_hist", "histogram", "ccdash_analytics_snapshot_latency_ms",
+     "Duration of analytics snapshot computation by project.",
+     ("project",)),
+    ("analytics_snapshot_rows_counter", "counter", "ccdash_analytics_snapshot_rows_total",
+     "Rows processed during analytics snapshot by project.",
+     ("project",)),
+    # 2. badge derivation latency
+    ("badge_derivation_latency_hist", "histogram", "ccdash_badge_derivation_latency_ms",
+     "Latency of session-list badge derivation with fast/slow path label.",
+     ("path",)),
+    # 3. sync insert batch size
+    ("sync_insert_batch_hist", "histogram", "ccdash_sync_insert_batch_size",
+     "Sizes of INSERT batches issued by the sync engine by table.",
+     ("table",)),
+    # 4. cache fingerprint cost
+    ("fingerprint_cost_hist", "histogram", "ccdash_fingerprint_cost_ms",
+     "Duration of cache fingerprint computation.",
+     ()),
+    # 5. SQLite cache-miss depth gauge
+    ("sqlite_cache_miss_gauge", "gauge", "ccdash_sqlite_cache_miss_depth",
+     "Live running count of SQLite cache misses since last reset.",
+     ()),
+    # 6. startup-sync duration
+    ("startup_sync_latency_hist", "histogram", "ccdash_startup_sync_latency_ms",
+     "Duration of startup sync operations by project.",
+     ("project",)),
+    # 7. feature-poll-interval gauge
+    ("feature_poll_interval_gauge", "gauge", "ccdash_feature_poll_interval_seconds",
+     "Current feature-poll interval in seconds.",
+     ()),
+    # 8. link-rebuild commit counter
+    ("link_rebuild_commit_counter", "counter", "ccdash_link_rebuild_commits_total",
+     "Link-rebuild commit completions with links_created count.",
+     ("links_created_bucket",)),
+    # ── Watcher liveness freshness probes (T12-005) ──────────────────
+    # Reconcile heartbeat counter (Prom mirror; no Prom gauge for age —
+    # the OTel observable gauge computes age at scrape time; a Prom gauge
+    # would require a background updater and is deferred).
+    ("reconcile_heartbeat_counter", "counter", "ccdash_reconcile_heartbeat_total",
+     "Reconcile-tick completions by result.",
+     ("result",)),
+)
+# Millisecond latency buckets for ``*_ms`` histograms; prometheus_client's defaults
+# are second-scale (0.005..10) and put nearly every observation in +Inf.
+_LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+_PROM_SPEC_KWARGS: dict[str, dict[str, Any]] = {
+    "workflow_detail_batch_rows_hist": {"buckets": [1, 5, 10, 25, 50, 100, 250, 500, 1000]},
+    "sync_insert_batch_hist": {"buckets": [1, 5, 10, 25, 50, 100, 250, 500, 1000]},
+}
+
 _RESOURCE_INSTANCE_ID = os.getenv("OTEL_SERVICE_INSTANCE_ID", "").strip() or str(uuid4())
 _RESOURCE_HOSTNAME = socket.gethostname().strip() or "unknown"
 
 
-def _normalize_otlp_endpoint(base_endpoint: str, signal_path: str) -> str:
-    endpoint = (base_endpoint or "").strip()
-    if not endpoint:
-        return ""
-    if endpoint.endswith(signal_path):
-        return endpoint
-    if endpoint.endswith("/"):
-        endpoint = endpoint[:-1]
-    if endpoint.endswith("/v1"):
-        return f"{endpoint}{signal_path[3:]}"
-    return f"{endpoint}{signal_path}"
+_OTLP_BASE_SUFFIX_RE = re.compile(r"(?:/v1)?/?$")
+
+
+def _make_otlp_normalizer(signal_path: str) -> Callable[[str], str]:
+    """Return a normalizer appending ``signal_path`` (e.g. ``/v1/traces``) to a base endpoint."""
+
+    def normalize(base_endpoint: str) -> str:
+        endpoint = (base_endpoint or "").strip()
+        if not endpoint:
+            return ""
+        if endpoint.endswith(signal_path):
+            return endpoint
+        return _OTLP_BASE_SUFFIX_RE.sub("", endpoint, count=1) + signal_path
+
+    return normalize
+
+
+_otlp_traces_endpoint = _make_otlp_normalizer("/v1/traces")
+_otlp_metrics_endpoint = _make_otlp_normalizer("/v1/metrics")
+
+
+_UNKNOWN = "unknown"
+
+
+def _label_value(value: str | None) -> str:
+    # Not interned: project/model/feature values are unbounded and interned strings
+    # are immortal on Python 3.12+.
+    return value or _UNKNOWN
+
+
+_PROM_OTHER_PROJECT = "other"
+_prom_seen_projects: set[str] = set()
+
+
+def _prom_project_label(project_id: str | None) -> str:
+    """Project label capped at ``PROM_MAX_PROJECTS`` distinct values; the rest share "other"."""
+    value = _label_value(project_id)
+    if value in _prom_seen_projects:
+        return value
+    if len(_prom_seen_projects) < config.PROM_MAX_PROJECTS:
+        _prom_seen_projects.add(value)
+        return value
+    return _PROM_OTHER_PROJECT
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_label_value(value: str | None) -> str:
+    """Stripped label value; repeat values skip the strip/fallback work."""
+    return _label_value((value or "").strip())
 
 
 def _prom_labels(*, project_id: str, **extra: str) -> dict[str, str]:
-    labels = {"project": project_id or "unknown"}
+    labels = {"project": _prom_project_label(project_id)}
     for key, value in extra.items():
-        labels[key] = (value or "").strip() or "unknown"
+        labels[key] = _clean_label_value(value)
     return labels
 
 
+@functools.lru_cache(maxsize=4096)
+def _prom_child(metric: Any, **labels: str) -> Any:
+    """Return the bound child for ``labels``; hot recorders reuse it per label set."""
+    return metric.labels(**labels)
+
+
 def _runtime_metric_dimensions(runtime_metadata: Mapping[str, Any] | None = None) -> dict[str, str]:
     metadata = runtime_metadata or {}
     return {
@@ -246,6 +441,127 @@ def _worker_metric_key(
     )
 
 
+def _build_otlp_exporters() -> tuple[Any, Any]:
+    """Return (span, metric) OTLP exporters for ``config.OTEL_PROTOCOL``.
+
+    gRPC reuses a single gzip-compressed channel across exports; proto-HTTP stays
+    the default and is used as the fallback when the gRPC exporter is missing.
+    """
+    if config.OTEL_PROTOCOL == "grpc":
+        try:
+            from grpc import Compression
+            from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import (
+                OTLPMetricExporter as GrpcMetricExporter,
+            )
+            from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+                OTLPSpanExporter as GrpcSpanExporter,
+            )
+        except ImportError as exc:
+            logger.warning("OTLP gRPC exporter unavailable, using http/protobuf: %s", exc)
+        else:
+            endpoint = (config.OTEL_ENDPOINT or "").strip() or None
+            return (
+                GrpcSpanExporter(endpoint=endpoint, compression=Compression.Gzip),
+                GrpcMetricExporter(endpoint=endpoint, compression=Compression.Gzip),
+            )
+
+    from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+    traces_endpoint = _otlp_traces_endpoint(config.OTEL_ENDPOINT)
+    metrics_endpoint = _otlp_metrics_endpoint(config.OTEL_ENDPOINT)
+    session = _shared_otlp_http_session()
+    return (
+        OTLPSpanExporter(endpoint=traces_endpoint or None, session=session),
+        OTLPMetricExporter(endpoint=metrics_endpoint or None, session=session),
+    )
+
+
+_OTLP_HTTP_CREDENTIAL_ENV_VARS = (
+    "OTEL_PYTHON_EXPORTER_OTLP_HTTP_CREDENTIAL_PROVIDER",
+    "OTEL_PYTHON_EXPORTER_OTLP_HTTP_TRACES_CREDENTIAL_PROVIDER",
+    "OTEL_PYTHON_EXPORTER_OTLP_HTTP_METRICS_CREDENTIAL_PROVIDER",
+)
+
+
+def _shared_otlp_http_session() -> Any:
+    """One ``requests.Session`` for both HTTP exporters; they target the same collector.
+
+    Returns None (each exporter builds its own) when an SDK credential-provider
+    session is configured, so that provider is still honoured.
+    """
+    if any(os.getenv(name) for name in _OTLP_HTTP_CREDENTIAL_ENV_VARS):
+        return None
+    import requests
+
+    return requests.Session()
+
+
+class _CircuitBreakerSpanExporter:
+    """Span exporter wrapper that stops calling an unreachable collector for a while.
+
+    After ``threshold`` consecutive failed exports, batches are dropped (and
+    counted) for ``cooldown_s`` seconds instead of each one waiting out the
+    exporter's own retry backoff while the processor queue fills up.
+    """
+
+    def __init__(self, inner: Any, *, threshold: int, cooldown_s: float) -> None:
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        self._inner = inner
+        self._threshold = max(1, int(threshold))
+        self._cooldown_s = max(0.0, float(cooldown_s))
+        self._success = SpanExportResult.SUCCESS
+        self._failure = SpanExportResult.FAILURE
+        self._failures = 0
+        self._open_until = 0.0
+        self.dropped_spans = 0
+
+    def export(self, spans: Any) -> Any:
+        if self._open_until and time.monotonic() < self._open_until:
+            self.dropped_spans += len(spans)
+            return self._success
+        try:
+            result = self._inner.export(spans)
+        except Exception:  # noqa: BLE001
+            logger.debug("Span export raised", exc_info=True)
+            result = None
+        if result is self._success:
+            self._failures = 0
+            self._open_until = 0.0
+            return result
+        self._failures += 1
+        if self._failures >= self._threshold:
+            self._open_until = time.monotonic() + self._cooldown_s
+            self._failures = 0
+            logger.warning(
+                "Span export failing; pausing exports for %.0fs (dropped so far: %s)",
+                self._cooldown_s,
+                self.dropped_spans,
+            )
+        return result if result is not None else self._failure
+
+    def shutdown(self) -> None:
+        self._inner.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self._inner.force_flush(timeout_millis)
+
+
+def _instrument_fastapi(app: FastAPI) -> None:
+    # The FastAPI/ASGI instrumentation stack is only needed by the API runtime,
+    # so the worker never imports it.
+    global _fastapi_instrumentor
+    if _fastapi_instrumentor is None:
+        try:
+            from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+        except ImportError as exc:
+            logger.warning("OpenTelemetry FastAPI instrumentation unavailable: %s", exc)
+            return
+        _fastapi_instrumentor = FastAPIInstrumentor()
+    _fastapi_instrumentor.instrument_app(app)
+
+
 def initialize(app: FastAPI | None = None) -> None:
     global _initialized, _enabled, _tracer, _trace_provider, _meter_provider, _fastapi_instrumentor
     global _ingestion_counter, _ingestion_latency_hist, _parser_failure_counter
@@ -259,37 +575,19 @@ def initialize(app: FastAPI | None = None) -> None:
     global _feature_surface_requests_counter, _feature_surface_latency_hist
     global _frontend_poll_teardown_counter, _link_rebuild_scope_counter
     global _filesystem_scan_cached_counter, _workflow_detail_batch_rows_hist
-    global _db_write_failures_counter, _prom_db_write_failures_counter
-    global _prom_enabled
-    global _prom_ingestion_counter, _prom_ingestion_latency_hist, _prom_parser_failure_counter
-    global _prom_tool_calls_counter, _prom_tool_duration_hist, _prom_tokens_counter, _prom_cost_counter
-    global _prom_telemetry_export_events_counter, _prom_telemetry_export_latency_hist
-    global _prom_telemetry_export_queue_depth_gauge, _prom_telemetry_export_errors_counter
-    global _prom_feature_surface_requests_counter, _prom_feature_surface_latency_hist
-    global _prom_telemetry_export_disabled_gauge
-    global _prom_worker_job_freshness_gauge, _prom_worker_job_backpressure_gauge
-    global _prom_auth_login_failures_counter, _prom_auth_session_errors_counter
-    global _prom_auth_authorization_decisions_counter, _prom_auth_issuer_health_counter
-    global _prom_frontend_poll_teardown_counter, _prom_link_rebuild_scope_counter
-    global _prom_filesystem_scan_cached_counter, _prom_workflow_detail_batch_rows_hist
+    global _db_write_failures_counter
+    global _prom_enabled, _prom_registry
     global _live_fanout_publish_latency_hist, _live_fanout_delivered_counter
     global _live_fanout_listener_received_counter, _watcher_sync_latency_hist
-    global _prom_live_fanout_publish_latency_hist, _prom_live_fanout_delivered_counter
-    global _prom_live_fanout_listener_received_counter, _prom_watcher_sync_latency_hist
     global _analytics_snapshot_latency_hist, _analytics_snapshot_rows_counter
-    global _prom_analytics_snapshot_latency_hist, _prom_analytics_snapshot_rows_counter
-    global _badge_derivation_latency_hist, _prom_badge_derivation_latency_hist
-    global _sync_insert_batch_hist, _prom_sync_insert_batch_hist
-    global _fingerprint_cost_hist, _prom_fingerprint_cost_hist
-    global _sqlite_cache_miss_gauge, _prom_sqlite_cache_miss_gauge
-    global _startup_sync_latency_hist, _prom_startup_sync_latency_hist
-    global _feature_poll_interval_gauge, _prom_feature_poll_interval_gauge
-    global _link_rebuild_commit_counter, _prom_link_rebuild_commit_counter
-    global _watcher_event_age_gauge, _reconcile_heartbeat_counter, _prom_reconcile_heartbeat_counter
+    global _badge_derivation_latency_hist, _sync_insert_batch_hist, _fingerprint_cost_hist
+    global _sqlite_cache_miss_gauge, _startup_sync_latency_hist, _feature_poll_interval_gauge
+    global _link_rebuild_commit_counter
+    global _watcher_event_age_gauge, _reconcile_heartbeat_counter
 
     if _initialized:
-        if _enabled and app and _fastapi_instrumentor:
-            _fastapi_instrumentor.instrument_app(app)
+        if _enabled and app:
+            _instrument_fastapi(app)
         return
 
     _initialized = True
@@ -300,12 +598,10 @@ def initialize(app: FastAPI | None = None) -> None:
 
     try:
         from opentelemetry import metrics, trace
-        from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
-        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-        from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
         from opentelemetry.metrics import Observation
-        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics import Histogram as HistogramInstrument, MeterProvider
         from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+        from opentelemetry.sdk.metrics.view import ExplicitBucketHistogramAggregation, View
         from opentelemetry.sdk.resources import Resource
         from opentelemetry.sdk.trace import TracerProvider
         from opentelemetry.sdk.trace.export import BatchSpanProcessor
@@ -313,8 +609,12 @@ def initialize(app: FastAPI | None = None) -> None:
         logger.warning("OpenTelemetry dependencies unavailable: %s", exc)
         return
 
-    traces_endpoint = _normalize_otlp_endpoint(config.OTEL_ENDPOINT, "/v1/traces")
-    metrics_endpoint = _normalize_otlp_endpoint(config.OTEL_ENDPOINT, "/v1/metrics")
+    try:
+        trace_exporter, metric_exporter = _build_otlp_exporters()
+    except ImportError as exc:
+        logger.warning("OpenTelemetry dependencies unavailable: %s", exc)
+        return
+
     service_name = config.OTEL_SERVICE_NAME or "ccdash-backend"
 
     resource = Resource.create(
@@ -327,15 +627,35 @@ def initialize(app: FastAPI | None = None) -> None:
     )
 
     trace_provider = TracerProvider(resource=resource)
-    trace_exporter = OTLPSpanExporter(endpoint=traces_endpoint or None)
-    trace_provider.add_span_processor(BatchSpanProcessor(trace_exporter))
+    trace_provider.add_span_processor(
+        BatchSpanProcessor(
+            _CircuitBreakerSpanExporter(
+                trace_exporter,
+                threshold=config.OTEL_EXPORT_BREAKER_THRESHOLD,
+                cooldown_s=config.OTEL_EXPORT_BREAKER_COOLDOWN_S,
+            ),
+            max_queue_size=config.OTEL_BSP_MAX_QUEUE_SIZE,
+            schedule_delay_millis=config.OTEL_BSP_SCHEDULE_DELAY_MS,
+            max_export_batch_size=config.OTEL_BSP_MAX_EXPORT_BATCH_SIZE,
+            export_timeout_millis=config.OTEL_BSP_EXPORT_TIMEOUT_MS,
+        )
+    )
     trace.set_tracer_provider(trace_provider)
     tracer = trace.get_tracer("ccdash.backend")
 
+    # The Python SDK has no reusable-memory mode, so a tighter export interval is
+    # what bounds how many points accumulate between collections.
     metric_reader = PeriodicExportingMetricReader(
-        OTLPMetricExporter(endpoint=metrics_endpoint or None)
+        metric_exporter,
+        export_interval_millis=config.OTEL_METRIC_EXPORT_INTERVAL_MS or 15000,
+        export_timeout_millis=config.OTEL_METRIC_EXPORT_TIMEOUT_MS or 5000,
     )
-    meter_provider = MeterProvider(resource=resource, metric_readers=[metric_reader])
+    latency_view = View(
+        instrument_type=HistogramInstrument,
+        instrument_name="ccdash_*_ms",
+        aggregation=ExplicitBucketHistogramAggregation(_LATENCY_BUCKETS_MS),
+    )
+    meter_provider = MeterProvider(resource=resource, metric_readers=[metric_reader], views=[latency_view])
     metrics.set_meter_provider(meter_provider)
     meter = metrics.get_meter("ccdash.backend")
 
@@ -593,228 +913,57 @@ def initialize(app: FastAPI | None = None) -> None:
     _trace_provider = trace_provider
     _meter_provider = meter_provider
     _tracer = tracer
-    _fastapi_instrumentor = FastAPIInstrumentor()
     _enabled = True
 
     if app:
-        _fastapi_instrumentor.instrument_app(app)
+        _instrument_fastapi(app)
 
-    if config.PROM_PORT > 0:
+    prom_mount_path = config.PROM_MOUNT_PATH if app is not None else ""
+    if config.PROM_PORT > 0 or prom_mount_path:
         try:
-            from prometheus_client import Counter, Gauge, Histogram, start_http_server
+            from prometheus_client import (
+                CollectorRegistry,
+                Counter,
+                GCCollector,
+                Gauge,
+                Histogram,
+                PlatformCollector,
+                ProcessCollector,
+                make_asgi_app,
+                start_http_server,
+            )
 
-            start_http_server(config.PROM_PORT)
+            # Dedicated registry: one namespace to walk per scrape, no contention
+            # with collectors other libraries put on the global REGISTRY.
+            registry = CollectorRegistry(auto_describe=False)
+            ProcessCollector(registry=registry)
+            PlatformCollector(registry=registry)
+            GCCollector(registry=registry)
+            metric_classes = {"counter": Counter, "gauge": Gauge, "histogram": Histogram}
+            module_globals = globals()
+            for attr, kind, name, desc, labels in _PROM_SPECS:
+                kwargs = _PROM_SPEC_KWARGS.get(attr)
+                if kwargs is None and kind == "histogram" and name.endswith("_ms"):
+                    kwargs = {"buckets": _LATENCY_BUCKETS_MS}
+                module_globals[f"_prom_{attr}"] = metric_classes[kind](
+                    name, desc, labels, registry=registry, **(kwargs or {})
+                )
+            if config.PROM_PORT > 0:
+                start_http_server(config.PROM_PORT, registry=registry)
+                logger.info("Prometheus fallback metrics server listening on port %s", config.PROM_PORT)
+            if prom_mount_path:
+                # Served by uvicorn's event loop instead of a thread-per-scrape server.
+                app.mount(prom_mount_path, make_asgi_app(registry=registry))
+                logger.info("Prometheus metrics mounted at %s", prom_mount_path)
+            _prom_registry = registry
             _prom_enabled = True
-            _prom_ingestion_counter = Counter(
-                "ccdash_ingestion_events_total",
-                "Count of telemetry ingestion operations",
-                ["entity", "result", "project", "source"],
-            )
-            _prom_ingestion_latency_hist = Histogram(
-                "ccdash_ingestion_latency_ms",
-                "Latency for parser and sync ingestion operations",
-                ["entity", "result", "project", "source"],
-            )
-            _prom_parser_failure_counter = Counter(
-                "ccdash_parser_failures_total",
-                "Count of parser failures",
-                ["parser", "project"],
-            )
-            _prom_tool_calls_counter = Counter(
-                "ccdash_tool_calls_total",
-                "Tool call outcomes observed while ingesting sessions",
-                ["tool", "status", "project"],
-            )
-            _prom_tool_duration_hist = Histogram(
-                "ccdash_tool_duration_ms",
-                "Observed tool execution durations",
-                ["tool", "project"],
-            )
-            _prom_tokens_counter = Counter(
-                "ccdash_tokens_total",
-                "Token totals by model and feature context",
-                ["model", "feature", "direction", "project"],
-            )
-            _prom_cost_counter = Counter(
-                "ccdash_cost_usd_total",
-                "Cost totals by model and feature context",
-                ["model", "feature", "project"],
-            )
-            _prom_telemetry_export_events_counter = Counter(
-                "ccdash_telemetry_export_events_total",
-                "Count of telemetry exporter batch outcomes",
-                ["status", "project", *_RUNTIME_PROM_LABEL_NAMES],
-            )
-            _prom_telemetry_export_latency_hist = Histogram(
-                "ccdash_telemetry_export_latency_ms",
-                "Latency for telemetry export batches",
-                ["project", *_RUNTIME_PROM_LABEL_NAMES],
-            )
-            _prom_telemetry_export_queue_depth_gauge = Gauge(
-                "ccdash_telemetry_export_queue_depth",
-                "Telemetry export queue depth by status and project",
-                ["status", "project", *_RUNTIME_PROM_LABEL_NAMES],
-            )
-            _prom_telemetry_export_errors_counter = Counter(
-                "ccdash_telemetry_export_errors_total",
-                "Telemetry export errors by class",
-                ["error_type", "project", *_RUNTIME_PROM_LABEL_NAMES],
-            )
-            _prom_telemetry_export_disabled_gauge = Gauge(
-                "ccdash_telemetry_export_disabled",
-                "Whether telemetry export is disabled",
-            )
-            _prom_worker_job_freshness_gauge = Gauge(
-                "ccdash_worker_job_freshness_ms",
-                "Age since the last successful worker job execution by job and runtime metadata",
-                ["job", "project", *_RUNTIME_PROM_LABEL_NAMES],
-            )
-            _prom_worker_job_backpressure_gauge = Gauge(
-                "ccdash_worker_job_backpressure_ratio",
-                "Worker job backlog pressure ratio by job and runtime metadata",
-                ["job", "project", *_RUNTIME_PROM_LABEL_NAMES],
-            )
-            _prom_auth_login_failures_counter = Counter(
-                "ccdash_auth_login_failures_total",
-                "Hosted auth login and callback failures by provider and phase",
-                ["provider", "phase", "status", "reason", "runtime_profile"],
-            )
-            _prom_auth_session_errors_counter = Counter(
-                "ccdash_auth_session_errors_total",
-                "Request/session authentication errors by provider",
-                ["provider", "status", "reason", "runtime_profile"],
-            )
-            _prom_auth_authorization_decisions_counter = Counter(
-                "ccdash_auth_authorization_decisions_total",
-                "Authorization decisions observed through the HTTP authorization seam",
-                ["action", "resource_type", "decision", "status", "provider", "runtime_profile"],
-            )
-            _prom_auth_issuer_health_counter = Counter(
-                "ccdash_auth_issuer_health_total",
-                "OIDC/hosted issuer health observations from auth flow seams",
-                ["provider", "issuer", "status", "runtime_profile"],
-            )
-            _prom_db_write_failures_counter = Counter(
-                "ccdash_db_write_failures_total",
-                "DB write failures (e.g. locked retries exhausted) by repo and reason",
-                ["repo", "reason"],
-            )
-            _prom_feature_surface_requests_counter = Counter(
-                "ccdash_feature_surface_requests_total",
-                "Feature-surface endpoint request count",
-                ["endpoint", "filter_kind", "result_count_bucket", "payload_bytes_bucket"],
-            )
-            _prom_feature_surface_latency_hist = Histogram(
-                "ccdash_feature_surface_latency_ms",
-                "Feature-surface endpoint latency in milliseconds",
-                ["endpoint", "filter_kind"],
-            )
-            # ── Runtime-performance-hardening metrics (OBS-401) ───────────────
-            _prom_frontend_poll_teardown_counter = Counter(
-                "ccdash_frontend_poll_teardown_total",
-                "Frontend polling teardown events triggered after sustained unreachability.",
-            )
-            _prom_link_rebuild_scope_counter = Counter(
-                "ccdash_link_rebuild_scope",
-                "Link rebuild dispatches by resolved scope.",
-                ["scope"],
-            )
-            _prom_filesystem_scan_cached_counter = Counter(
-                "ccdash_filesystem_scan_cached_total",
-                "Filesystem scan invocations skipped via light-mode manifest cache.",
-            )
-            _prom_workflow_detail_batch_rows_hist = Histogram(
-                "ccdash_workflow_detail_batch_rows",
-                "Workflow-detail batch query row counts.",
-                ["endpoint"],
-                buckets=[1, 5, 10, 25, 50, 100, 250, 500, 1000],
-            )
-            # ── Live-fanout + watcher metrics (FU-5) ─────────────────────────
-            _prom_live_fanout_publish_latency_hist = Histogram(
-                "ccdash_live_fanout_publish_latency_ms",
-                "Latency of cross-process live fanout publish operations.",
-                ["scope"],
-            )
-            _prom_live_fanout_delivered_counter = Counter(
-                "ccdash_live_fanout_delivered_total",
-                "Cross-process live fanout publish outcomes by result.",
-                ["result"],
-            )
-            _prom_live_fanout_listener_received_counter = Counter(
-                "ccdash_live_fanout_listener_received_total",
-                "Postgres NOTIFY envelopes received and processed by the API listener.",
-                ["result"],
-            )
-            _prom_watcher_sync_latency_hist = Histogram(
-                "ccdash_watcher_sync_latency_ms",
-                "Latency of file-watcher-triggered sync_changed_files calls.",
-            )
-            # ── Phase-6 Wave-A: new Prometheus mirrors ────────────────────────
-            # 1. analytics-snapshot
-            _prom_analytics_snapshot_latency_hist = Histogram(
-                "ccdash_analytics_snapshot_latency_ms",
-                "Duration of analytics snapshot computation by project.",
-                ["project"],
-            )
-            _prom_analytics_snapshot_rows_counter = Counter(
-                "ccdash_analytics_snapshot_rows_total",
-                "Rows processed during analytics snapshot by project.",
-                ["project"],
-            )
-            # 2. badge derivation latency
-            _prom_badge_derivation_latency_hist = Histogram(
-                "ccdash_badge_derivation_latency_ms",
-                "Latency of session-list badge derivation with fast/slow path label.",
-                ["path"],
-            )
-            # 3. sync insert batch size
-            _prom_sync_insert_batch_hist = Histogram(
-                "ccdash_sync_insert_batch_size",
-                "Sizes of INSERT batches issued by the sync engine by table.",
-                ["table"],
-                buckets=[1, 5, 10, 25, 50, 100, 250, 500, 1000],
-            )
-            # 4. cache fingerprint cost
-            _prom_fingerprint_cost_hist = Histogram(
-                "ccdash_fingerprint_cost_ms",
-                "Duration of cache fingerprint computation.",
-            )
-            # 5. SQLite cache-miss depth gauge
-            _prom_sqlite_cache_miss_gauge = Gauge(
-                "ccdash_sqlite_cache_miss_depth",
-                "Live running count of SQLite cache misses since last reset.",
-            )
-            # 6. startup-sync duration
-            _prom_startup_sync_latency_hist = Histogram(
-                "ccdash_startup_sync_latency_ms",
-                "Duration of startup sync operations by project.",
-                ["project"],
-            )
-            # 7. feature-poll-interval gauge
-            _prom_feature_poll_interval_gauge = Gauge(
-                "ccdash_feature_poll_interval_seconds",
-                "Current feature-poll interval in seconds.",
-            )
-            # 8. link-rebuild commit counter
-            _prom_link_rebuild_commit_counter = Counter(
-                "ccdash_link_rebuild_commits_total",
-                "Link-rebuild commit completions with links_created count.",
-                ["links_created_bucket"],
-            )
-            # ── Watcher liveness freshness probes (T12-005) ──────────────────
-            # Reconcile heartbeat counter (Prom mirror; no Prom gauge for age —
-            # the OTel observable gauge computes age at scrape time; a Prom gauge
-            # would require a background updater and is deferred).
-            _prom_reconcile_heartbeat_counter = Counter(
-                "ccdash_reconcile_heartbeat_total",
-                "Reconcile-tick completions by result.",
-                ["result"],
-            )
-            logger.info("Prometheus fallback metrics server listening on port %s", config.PROM_PORT)
         except Exception as exc:  # noqa: BLE001
             logger.warning("Prometheus fallback not started: %s", exc)
             _prom_enabled = False
 
+    if config.OTEL_DEFERRED_RECORDING:
+        _start_deferred_recording()
+
     logger.info(
         "OpenTelemetry initialized (service=%s endpoint=%s)",
         service_name,
@@ -831,6 +980,7 @@ def shutdown(app: FastAPI | None = None) -> None:
             _fastapi_instrumentor.uninstrument_app(app)
     except Exception:
         pass
+    _stop_deferred_recording()
     try:
         if _meter_provider is not None:
             _meter_provider.shutdown()
@@ -841,23 +991,140 @@ def shutdown(app: FastAPI | None = None) -> None:
             _trace_provider.shutdown()
     except Exception:
         pass
+    _prom_child.cache_clear()
+    _prom_seen_projects.clear()
+    _clean_label_value.cache_clear()
+    _token_label_sets.cache_clear()
     _enabled = False
 
 
-@contextmanager
+class _NullSpanContext:
+    """Shared no-op context returned by ``start_span`` while tracing is off."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        return False
+
+
+_NULL_SPAN_CONTEXT = _NullSpanContext()
+
+
+class _SpanContext:
+    """Plain context manager around ``start_as_current_span``; avoids a generator per span."""
+
+    __slots__ = ("_name", "_attributes", "_runtime_metadata", "_span_cm")
+
+    def __init__(
+        self,
+        name: str,
+        attributes: dict[str, Any] | None,
+        runtime_metadata: Mapping[str, Any] | None,
+    ) -> None:
+        self._name = name
+        self._attributes = attributes
+        self._runtime_metadata = runtime_metadata
+        self._span_cm: Any = None
+
+    def __enter__(self) -> Any:
+        self._span_cm = _tracer.start_as_current_span(self._name)
+        span = self._span_cm.__enter__()
+        try:
+            span_attributes = _runtime_span_attributes(self._runtime_metadata)
+            if self._attributes:
+                for key, value in self._attributes.items():
+                    if value is not None:
+                        span_attributes[key] = value
+                    else:
+                        span_attributes.pop(key, None)
+            span.set_attributes(span_attributes)
+        except BaseException:
+            if not self._span_cm.__exit__(*sys.exc_info()):
+                raise
+        return span
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
+        return bool(self._span_cm.__exit__(exc_type, exc, tb))
+
+
 def start_span(
     name: str,
     attributes: dict[str, Any] | None = None,
     runtime_metadata: Mapping[str, Any] | None = None,
-):
+) -> _SpanContext | _NullSpanContext:
     if not _enabled or _tracer is None:
-        yield None
+        return _NULL_SPAN_CONTEXT
+    return _SpanContext(name, attributes, runtime_metadata)
+
+
+# Deferred recording (CCDASH_OTEL_DEFERRED_RECORDING): the hot recorders append
+# (fn, args) to a bounded deque and a background task applies them in batches.
+_RECORD_DRAIN_BATCH = 256
+_RECORD_DRAIN_IDLE_S = 0.05
+_record_queue: deque[tuple[Callable[..., None], tuple[Any, ...]]] | None = None
+_record_queue_dropped = 0
+_record_drain_task: asyncio.Task[None] | None = None
+
+
+def _defer_record(fn: Callable[..., None], args: tuple[Any, ...]) -> bool:
+    global _record_queue_dropped
+    queue = _record_queue
+    if queue is None:
+        return False
+    if len(queue) >= (queue.maxlen or 0):
+        _record_queue_dropped += 1
+        return True
+    queue.append((fn, args))
+    return True
+
+
+def _drain_record_queue(limit: int | None = None) -> int:
+    queue = _record_queue
+    drained = 0
+    while queue and (limit is None or drained < limit):
+        try:
+            fn, args = queue.popleft()
+        except IndexError:
+            break
+        try:
+            fn(*args)
+        except Exception:  # noqa: BLE001
+            logger.debug("Deferred metric record failed", exc_info=True)
+        drained += 1
+    return drained
+
+
+async def _run_record_drain() -> None:
+    while True:
+        if _drain_record_queue(_RECORD_DRAIN_BATCH) < _RECORD_DRAIN_BATCH:
+            await asyncio.sleep(_RECORD_DRAIN_IDLE_S)
+        else:
+            await asyncio.sleep(0)
+
+
+def _start_deferred_recording() -> None:
+    global _record_queue, _record_drain_task
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.warning("Deferred metric recording needs a running event loop; recording inline")
         return
-    with _tracer.start_as_current_span(name) as span:
-        for key, value in {**_runtime_span_attributes(runtime_metadata), **(attributes or {})}.items():
-            if value is not None:
-                span.set_attribute(key, value)
-        yield span
+    _record_queue = deque(maxlen=max(1, config.OTEL_RECORD_QUEUE_SIZE))
+    _record_drain_task = loop.create_task(_run_record_drain(), name="ccdash-otel-record-drain")
+
+
+def _stop_deferred_recording() -> None:
+    global _record_queue, _record_drain_task
+    if _record_drain_task is not None:
+        _record_drain_task.cancel()
+        _record_drain_task = None
+    _drain_record_queue()
+    _record_queue = None
+    if _record_queue_dropped:
+        logger.warning("Dropped %s deferred metric records (queue full)", _record_queue_dropped)
 
 
 def record_ingestion(
@@ -868,65 +1135,98 @@ def record_ingestion(
     project_id: str,
     source: str | None = None,
 ) -> None:
-    labels = {
-        "entity": entity or "unknown",
-        "result": result or "unknown",
-        "project_id": project_id or "unknown",
-        "source": source or "unknown",
-    }
-    if _enabled and _ingestion_counter is not None:
-        _ingestion_counter.add(1, labels)
-    if _enabled and _ingestion_latency_hist is not None:
-        _ingestion_latency_hist.record(max(0.0, float(duration_ms)), labels)
-    if _prom_enabled and _prom_ingestion_counter is not None:
-        prom = _prom_labels(
-            project_id=project_id,
-            entity=entity,
-            result=result,
-            source=source or "unknown",
-        )
-        _prom_ingestion_counter.labels(**prom).inc()
-    if _prom_enabled and _prom_ingestion_latency_hist is not None:
+    if not (_enabled or _prom_enabled):
+        return
+    if not _defer_record(_apply_ingestion, (entity, result, duration_ms, project_id, source)):
+        _apply_ingestion(entity, result, duration_ms, project_id, source)
+
+
+def _apply_ingestion(
+    entity: str,
+    result: str,
+    duration_ms: float,
+    project_id: str,
+    source: str | None,
+) -> None:
+    latency_ms = max(0.0, float(duration_ms))
+    if _enabled:
+        labels = {
+            "entity": _label_value(entity),
+            "result": _label_value(result),
+            "project_id": _label_value(project_id),
+            "source": _label_value(source),
+        }
+        if _ingestion_counter is not None:
+            _ingestion_counter.add(1, labels)
+        if _ingestion_latency_hist is not None:
+            _ingestion_latency_hist.record(latency_ms, labels)
+    if _prom_enabled:
         prom = _prom_labels(
             project_id=project_id,
             entity=entity,
             result=result,
-            source=source or "unknown",
+            source=source,
         )
-        _prom_ingestion_latency_hist.labels(**prom).observe(max(0.0, float(duration_ms)))
+        if _prom_ingestion_counter is not None:
+            _prom_child(_prom_ingestion_counter, **prom).inc()
+        if _prom_ingestion_latency_hist is not None:
+            _prom_child(_prom_ingestion_latency_hist, **prom).observe(latency_ms)
 
 
 def record_parser_failure(parser: str, *, project_id: str) -> None:
-    labels = {
-        "parser": parser or "unknown",
-        "project_id": project_id or "unknown",
-    }
+    if not (_enabled or _prom_enabled):
+        return
     if _enabled and _parser_failure_counter is not None:
-        _parser_failure_counter.add(1, labels)
+        _parser_failure_counter.add(1, {"parser": _label_value(parser), "project_id": _label_value(project_id)})
     if _prom_enabled and _prom_parser_failure_counter is not None:
         prom = _prom_labels(project_id=project_id, parser=parser)
-        _prom_parser_failure_counter.labels(**prom).inc()
+        _prom_child(_prom_parser_failure_counter, **prom).inc()
 
 
 def record_tool_result(tool: str, status: str, *, project_id: str, count: int = 1, duration_ms: float = 0.0) -> None:
+    if not (_enabled or _prom_enabled):
+        return
     safe_count = max(0, int(count))
     if safe_count == 0:
         return
-    labels = {
-        "tool": tool or "unknown",
-        "status": status or "unknown",
-        "project_id": project_id or "unknown",
-    }
-    if _enabled and _tool_calls_counter is not None:
-        _tool_calls_counter.add(safe_count, labels)
-    if _enabled and _tool_duration_hist is not None and duration_ms > 0:
-        _tool_duration_hist.record(float(duration_ms), labels)
+    if not _defer_record(_apply_tool_result, (tool, status, project_id, safe_count, duration_ms)):
+        _apply_tool_result(tool, status, project_id, safe_count, duration_ms)
+
+
+def _apply_tool_result(tool: str, status: str, project_id: str, safe_count: int, duration_ms: float) -> None:
+    if _enabled:
+        labels = {
+            "tool": _label_value(tool),
+            "status": _label_value(status),
+            "project_id": _label_value(project_id),
+        }
+        if _tool_calls_counter is not None:
+            _tool_calls_counter.add(safe_count, labels)
+        if _tool_duration_hist is not None and duration_ms > 0:
+            _tool_duration_hist.record(float(duration_ms), labels)
     if _prom_enabled and _prom_tool_calls_counter is not None:
         prom = _prom_labels(project_id=project_id, tool=tool, status=status)
-        _prom_tool_calls_counter.labels(**prom).inc(safe_count)
+        _prom_child(_prom_tool_calls_counter, **prom).inc(safe_count)
     if _prom_enabled and _prom_tool_duration_hist is not None and duration_ms > 0:
         prom = _prom_labels(project_id=project_id, tool=tool)
-        _prom_tool_duration_hist.labels(**prom).observe(float(duration_ms))
+        _prom_child(_prom_tool_duration_hist, **prom).observe(float(duration_ms))
+
+
+@functools.lru_cache(maxsize=1024)
+def _token_label_sets(
+    model: str | None, feature_id: str | None, project_id: str | None
+) -> tuple[dict[str, str], dict[str, str], dict[str, str]]:
+    """Shared (base, input, output) OTel label dicts per model/feature/project.
+
+    Callers must treat the dicts as read-only; they are handed to the SDK on
+    every LLM call instead of being rebuilt.
+    """
+    base = {
+        "model": _label_value((model or "").strip()),
+        "feature_id": (feature_id or "").strip() or "none",
+        "project_id": _label_value(project_id),
+    }
+    return base, {**base, "direction": "input"}, {**base, "direction": "output"}
 
 
 def record_token_cost(
@@ -938,30 +1238,45 @@ def record_token_cost(
     token_output: int,
     cost_usd: float,
 ) -> None:
-    labels_base = {
-        "model": (model or "unknown").strip() or "unknown",
-        "feature_id": (feature_id or "none").strip() or "none",
-        "project_id": project_id or "unknown",
-    }
+    if not (_enabled or _prom_enabled):
+        return
     in_tokens = max(0, int(token_input))
     out_tokens = max(0, int(token_output))
-    if _enabled and _tokens_counter is not None:
-        if in_tokens > 0:
-            _tokens_counter.add(in_tokens, {**labels_base, "direction": "input"})
-        if out_tokens > 0:
-            _tokens_counter.add(out_tokens, {**labels_base, "direction": "output"})
-    if _enabled and _cost_counter is not None and cost_usd > 0:
-        _cost_counter.add(float(cost_usd), labels_base)
-
-    if _prom_enabled and _prom_tokens_counter is not None:
-        prom_base = _prom_labels(project_id=project_id, model=model, feature=feature_id or "none")
-        if in_tokens > 0:
-            _prom_tokens_counter.labels(**{**prom_base, "direction": "input"}).inc(in_tokens)
-        if out_tokens > 0:
-            _prom_tokens_counter.labels(**{**prom_base, "direction": "output"}).inc(out_tokens)
-    if _prom_enabled and _prom_cost_counter is not None and cost_usd > 0:
+    args = (project_id, model, feature_id, in_tokens, out_tokens, cost_usd)
+    if not _defer_record(_apply_token_cost, args):
+        _apply_token_cost(*args)
+
+
+def _apply_token_cost(
+    project_id: str,
+    model: str,
+    feature_id: str,
+    in_tokens: int,
+    out_tokens: int,
+    cost_usd: float,
+) -> None:
+    if _enabled:
+        labels_base, labels_in, labels_out = _token_label_sets(model, feature_id, project_id)
+        if _tokens_counter is not None:
+            for count, labels in ((in_tokens, labels_in), (out_tokens, labels_out)):
+                if count > 0:
+                    _tokens_counter.add(count, labels)
+        if _cost_counter is not None and cost_usd > 0:
+            _cost_counter.add(float(cost_usd), labels_base)
+
+    if _prom_enabled:
+        # Label kwargs are copied per call, so one dict is built and the direction
+        # label is swapped in place between the input and output increments.
         prom_base = _prom_labels(project_id=project_id, model=model, feature=feature_id or "none")
-        _prom_cost_counter.labels(**prom_base).inc(float(cost_usd))
+        if _prom_cost_counter is not None and cost_usd > 0:
+            _prom_child(_prom_cost_counter, **prom_base).inc(float(cost_usd))
+        if _prom_tokens_counter is not None:
+            if in_tokens > 0:
+                prom_base["direction"] = "input"
+                _prom_child(_prom_tokens_counter, **prom_base).inc(in_tokens)
+            if out_tokens > 0:
+                prom_base["direction"] = "output"
+                _prom_child(_prom_tokens_counter, **prom_base).inc(out_tokens)
 
 
 def record_telemetry_export_event(
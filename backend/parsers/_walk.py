@@ -0,0 +1,33 @@
+"""Markdown directory walking shared by the document and feature parsers."""
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+
+
+def iter_markdown_entries(root: str) -> Iterator[os.DirEntry]:
+    """Yield ``os.DirEntry`` objects for non-hidden ``.md`` files below ``root``.
+
+    Mirrors ``Path.rglob("*.md")``: hidden directories are searched, symlinked
+    directories are not descended into, and unreadable directories are skipped.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            continue
+        if is_dir:
+            yield from iter_markdown_entries(entry.path)
+        elif entry.name.endswith(".md") and not entry.name.startswith("."):
+            yield entry
+
+
+def sorted_markdown_entries(root: str) -> list[os.DirEntry]:
+    """Return ``iter_markdown_entries(root)`` in ``sorted(Path(root).rglob("*.md"))`` order."""
+    # Sort by path components to keep Path ordering ("a/x.md" before "a-b/x.md").
+    return sorted(iter_markdown_entries(root), key=lambda e: e.path.split(os.sep))
@@ -1,13 +1,21 @@
 """Parse markdown documentation files into typed PlanDocument models."""
 from __future__ import annotations
 
+import functools
+import itertools
 import re
+import sys
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:  # libyaml-backed loader is several times faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 from backend.models import (
     PlanDocument,
     DocumentFrontmatter,
@@ -29,6 +37,7 @@ from backend.document_linking import (
     normalize_doc_status,
     normalize_ref_path,
 )
+from backend.parsers._walk import sorted_markdown_entries
 from backend.date_utils import (
     choose_first,
     choose_latest,
@@ -37,9 +46,51 @@ from backend.date_utils import (
     normalize_iso_date,
 )
 
-_DONE_STATUSES = {"done", "completed", "complete"}
-_IN_PROGRESS_STATUSES = {"in-progress", "in_progress", "active", "working"}
-_BLOCKED_STATUSES = {"blocked", "waiting", "stalled"}
+_DOC_CONTENT_MAX_CHARS = 5000
+_TITLE_SEPARATORS = str.maketrans("-_", "  ")
+_DOC_READ_WINDOW_BYTES = 64 * 1024
+# No trailing body group: the body is sliced from match.end(), so the regex never
+# has to walk the rest of a large document.
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n?", re.DOTALL)
+_PHASE_RE = re.compile(r"^phase[-_ ]?(\d+)")
+# Canonical frontmatter field -> alias keys, in precedence order. The first truthy
+# alias wins, matching the ``fm.get(a) or fm.get(b) ...`` chains these replace.
+_FM_KEY_ALIASES: dict[str, tuple[str, ...]] = {
+    "commits": ("commits", "commit", "git_commit", "git_commits", "git_commit_hashes"),
+    "prs": ("prs", "pr", "pull_requests", "pullRequests"),
+    "type": ("type", "doc_type", "doctype"),
+    "feature_slug": ("feature_slug", "feature", "feature_id", "feature_slug_hint"),
+    "feature_family": ("feature_family", "lineage_family"),
+    "lineage_family": ("lineage_family", "feature_family"),
+    "lineage_parent": (
+        "lineage_parent",
+        "parent_feature",
+        "parent_feature_slug",
+        "extends_feature",
+        "derived_from",
+        "supersedes",
+    ),
+    "lineage_children": ("lineage_children", "child_features", "superseded_by"),
+    "lineage_type": ("lineage_type", "lineage_relationship", "feature_lineage_type"),
+    "files_affected": ("files_affected", "filesAffected"),
+    "files_modified": ("files_modified", "filesModified"),
+    "context_files": ("context_files", "contextFiles"),
+    "owners": ("owner", "owners"),
+}
+# The only frontmatter keys the document_linking classifiers consult.
+_CLASSIFIER_FM_KEYS = ("type", "doc_type", "doctype", "doc_subtype", "docSubtype", "subtype", "category")
+# Keys checked, in order, for the string value of a dict entry in a frontmatter list.
+_STRING_ENTRY_KEYS = ("id", "path", "value", "url", "hash", "commit")
+
+_DONE_STATUSES = frozenset({"done", "completed", "complete"})
+_IN_PROGRESS_STATUSES = frozenset({"in-progress", "in_progress", "active", "working"})
+_BLOCKED_STATUSES = frozenset({"blocked", "waiting", "stalled"})
+# Task status token -> index into (completed, in_progress, blocked); done wins on overlap.
+_TASK_STATUS_BUCKET = {
+    **{token: 2 for token in _BLOCKED_STATUSES},
+    **{token: 1 for token in _IN_PROGRESS_STATUSES},
+    **{token: 0 for token in _DONE_STATUSES},
+}
 
 _NORMALIZED_STATUS = {
     "completed": "completed",
@@ -59,12 +110,12 @@ _NORMALIZED_STATUS = {
     "blocked": "blocked",
     "archived": "archived",
 }
-_COMPLETION_EQUIVALENT_STATUSES = {"completed", "inferred_complete", "deferred"}
-_PRIORITY_LEVELS = {"low", "medium", "high", "critical"}
-_RISK_LEVELS = {"low", "medium", "high", "critical"}
-_TEST_IMPACT_LEVELS = {"none", "low", "medium", "high", "critical"}
-_DECISION_STATUSES = {"proposed", "approved", "accepted", "superseded", "rejected", "draft"}
-_EXECUTION_READINESS_STATES = {"unknown", "not_ready", "needs_inputs", "ready", "in_progress", "complete"}
+_COMPLETION_EQUIVALENT_STATUSES = frozenset({"completed", "inferred_complete", "deferred"})
+_PRIORITY_LEVELS = frozenset({"low", "medium", "high", "critical"})
+_RISK_LEVELS = frozenset({"low", "medium", "high", "critical"})
+_TEST_IMPACT_LEVELS = frozenset({"none", "low", "medium", "high", "critical"})
+_DECISION_STATUSES = frozenset({"proposed", "approved", "accepted", "superseded", "rejected", "draft"})
+_EXECUTION_READINESS_STATES = frozenset({"unknown", "not_ready", "needs_inputs", "ready", "in_progress", "complete"})
 _DOC_TYPE_FIELD_KEYS: dict[str, set[str]] = {
     "prd": {
         "problem_statement",
@@ -158,18 +209,99 @@ _DOC_TYPE_FIELD_ALIASES: dict[str, dict[str, tuple[str, ...]]] = {
 }
 
 
-def _extract_frontmatter(text: str) -> tuple[dict[str, Any], str, bool]:
-    match = re.match(r"^---\s*\n(.*?)\n---\s*\n?(.*)", text, re.DOTALL)
+def _extract_frontmatter(
+    text: str,
+    max_body: int = _DOC_CONTENT_MAX_CHARS,
+) -> tuple[dict[str, Any], str, bool]:
+    # Most markdown has no frontmatter; skip the DOTALL scan over the whole body.
+    if not text.startswith("---"):
+        return {}, text[:max_body], False
+    match = _FRONTMATTER_RE.match(text)
     if not match:
-        return {}, text, False
+        return {}, text[:max_body], False
     try:
-        fm = yaml.safe_load(match.group(1)) or {}
+        fm = yaml.load(match.group(1), Loader=_YamlLoader) or {}
     except yaml.YAMLError:
         fm = {}
     if not isinstance(fm, dict):
         fm = {}
-    body = match.group(2)
-    return fm, body, True
+    # Slice the body straight out of ``text`` so the full tail is never copied.
+    body_start = match.end()
+    return fm, text[body_start:body_start + max_body], True
+
+
+def _read_document(path: Path) -> tuple[dict[str, Any], str, bool]:
+    """Read frontmatter and the leading body of ``path`` without decoding the whole file.
+
+    Only the first ``_DOC_READ_WINDOW_BYTES`` are read and decoded. The full file is
+    read only when the frontmatter does not close inside that window or the body
+    window is shorter than ``_DOC_CONTENT_MAX_CHARS``.
+    """
+    with path.open("rb") as handle:
+        raw = handle.read(_DOC_READ_WINDOW_BYTES + 1)
+    if len(raw) <= _DOC_READ_WINDOW_BYTES:
+        return _extract_frontmatter(raw.decode("utf-8"))
+    cut = _DOC_READ_WINDOW_BYTES
+    while cut > 0 and (raw[cut] & 0xC0) == 0x80:  # don't split a UTF-8 sequence
+        cut -= 1
+    fm, body, had_frontmatter = _extract_frontmatter(raw[:cut].decode("utf-8"))
+    if len(body) >= _DOC_CONTENT_MAX_CHARS and (had_frontmatter or not body.startswith("---")):
+        return fm, body, had_frontmatter
+    return _extract_frontmatter(path.read_text(encoding="utf-8"))
+
+
+def _canonicalize_frontmatter(fm: dict[str, Any]) -> dict[str, Any]:
+    """Resolve every ``_FM_KEY_ALIASES`` field to its first truthy alias value, or None."""
+    canonical: dict[str, Any] = {}
+    for field, aliases in _FM_KEY_ALIASES.items():
+        value = None
+        for alias in aliases:
+            candidate = fm.get(alias)
+            if candidate:
+                value = candidate
+                break
+        canonical[field] = value
+    return canonical
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_path_cached(
+    canonical_path: str,
+    classifier_fm: tuple[tuple[str, Any], ...],
+) -> tuple[str, str, str, str]:
+    return _classify_path(canonical_path, dict(classifier_fm))
+
+
+def _classify_path(canonical_path: str, fm: dict[str, Any]) -> tuple[str, str, str, str]:
+    # Doc type and root kind come from closed vocabularies, so interning them is bounded.
+    # Subtype and category may echo free-text frontmatter and are left alone.
+    return (
+        sys.intern(classify_doc_type(canonical_path, fm)),
+        classify_doc_subtype(canonical_path, fm),
+        sys.intern(detect_root_kind(canonical_path)),
+        classify_doc_category(canonical_path, fm),
+    )
+
+
+def _classify_document(canonical_path: str, fm: dict[str, Any]) -> tuple[str, str, str, str]:
+    """Return ``(doc_type, doc_subtype, root_kind, category)``, memoized on the inputs the classifiers read."""
+    classifier_fm = tuple((key, fm[key]) for key in _CLASSIFIER_FM_KEYS if key in fm)
+    # Only memoize string values: lists aren't hashable and 1/True would share a key.
+    if all(isinstance(value, str) for _, value in classifier_fm):
+        return _classify_path_cached(canonical_path, classifier_fm)
+    return _classify_path(canonical_path, fm)
+
+
+@functools.lru_cache(maxsize=4096)
+def _path_alias_tokens(canonical_path: str) -> frozenset[str]:
+    return frozenset(alias_tokens_from_path(canonical_path))
+
+
+def _ref_strings(refs: dict[str, Any], key: str) -> list[str]:
+    values = refs.get(key)
+    if not values:
+        return []
+    return [v if type(v) is str else str(v) for v in values if isinstance(v, str)]
 
 
 def _to_string_list(value: Any) -> list[str]:
@@ -184,11 +316,13 @@ def _to_string_list(value: Any) -> list[str]:
                 if text:
                     items.append(text)
             elif isinstance(entry, dict):
-                for key in ("id", "path", "value", "url", "hash", "commit"):
+                for key in _STRING_ENTRY_KEYS:
                     raw = entry.get(key)
-                    if isinstance(raw, str) and raw.strip():
-                        items.append(raw.strip())
-                        break
+                    if isinstance(raw, str):
+                        text = raw.strip()
+                        if text:
+                            items.append(text)
+                            break
         return items
     if isinstance(value, dict):
         items: list[str] = []
@@ -364,13 +498,31 @@ def _to_optional_int(value: Any) -> int | None:
 
 
 def _normalize_status(status: str) -> str:
+    # Exact hit first: most frontmatter already spells the status in lower case.
+    normalized = _STATUS_FAST_PATH.get(status)
+    if normalized is not None:
+        return normalized
     token = (status or "").strip().lower()
+    normalized = _STATUS_FAST_PATH.get(token)
+    if normalized is not None:
+        return normalized
+    return _normalize_status_token(token)
+
+
+def _normalize_status_token(token: str) -> str:
     if not token:
         return "pending"
     mapped = _NORMALIZED_STATUS.get(token, token.replace("-", "_"))
     return normalize_doc_status(mapped, default="pending")
 
 
+# Common status spellings resolved once at import through the full normalization path.
+_STATUS_FAST_PATH = {
+    token: _normalize_status_token(token)
+    for token in {*_NORMALIZED_STATUS, *_NORMALIZED_STATUS.values(), *_COMPLETION_EQUIVALENT_STATUSES}
+}
+
+
 def _stringify_timeline_estimate(value: Any) -> str:
     if value is None or isinstance(value, bool):
         return ""
@@ -411,6 +563,9 @@ def _build_document_date_fields(path: Path, fm: dict[str, Any], status_normalize
     return _build_document_date_fields_with_git(path, fm, status_normalized)
 
 
+_EMPTY_GIT_DATES: dict[str, str] = {}  # read-only default for paths missing from the git index
+
+
 def _build_document_date_fields_with_git(
     path: Path,
     fm: dict[str, Any],
@@ -419,9 +574,8 @@ def _build_document_date_fields_with_git(
     git_date_index: dict[str, dict[str, str]] | None = None,
     dirty_paths: set[str] | None = None,
 ) -> tuple[str, str, str, dict[str, Any], list[dict[str, Any]]]:
-    fs_dates = file_metadata_dates(path)
-    git_dates = (git_date_index or {}).get(canonical_path, {})
-    dirty = canonical_path in (dirty_paths or set())
+    git_dates = git_date_index.get(canonical_path, _EMPTY_GIT_DATES) if git_date_index else _EMPTY_GIT_DATES
+    dirty = bool(dirty_paths) and canonical_path in dirty_paths
 
     fm_created = _frontmatter_date(fm, "created", "created_at", "date_created")
     fm_updated = _frontmatter_date(fm, "updated", "updated_at", "last_updated", "modified", "modified_at")
@@ -429,32 +583,50 @@ def _build_document_date_fields_with_git(
     git_created = normalize_iso_date(git_dates.get("createdAt"))
     git_updated = normalize_iso_date(git_dates.get("updatedAt"))
 
-    created = choose_first([
-        make_date_value(fm_created, "high", "frontmatter", "created"),
-        make_date_value(git_created, "high", "git", "first_commit"),
-        make_date_value(fs_dates.get("createdAt", ""), "medium", "filesystem", "file_birthtime"),
-        make_date_value(fs_dates.get("updatedAt", ""), "low", "filesystem", "mtime_fallback")
-        if not git_created else {},
-    ])
-    updated_candidates = [
-        make_date_value(git_updated, "high", "git", "latest_commit"),
-        make_date_value(fm_updated, "medium", "frontmatter", "updated"),
-        make_date_value(fs_dates.get("updatedAt", ""), "high", "filesystem", "dirty_worktree")
-        if dirty else {},
-        make_date_value(fs_dates.get("updatedAt", ""), "low", "filesystem", "mtime_fallback")
-        if not git_updated and not fm_updated else {},
-        make_date_value(fm_created, "low", "frontmatter", "created_fallback"),
-    ]
-    updated = choose_latest([
-        candidate for candidate in updated_candidates if candidate
-    ])
-    completed = choose_first([
-        make_date_value(fm_completed, "high", "frontmatter", "completed"),
-        make_date_value(fm_updated, "medium", "frontmatter", "updated_completion_fallback")
-        if status_normalized in _COMPLETION_EQUIVALENT_STATUSES else {},
-        make_date_value(fs_dates.get("updatedAt", ""), "low", "filesystem", "mtime_completion_fallback")
-        if status_normalized in _COMPLETION_EQUIVALENT_STATUSES else {},
-    ])
+    # Filesystem dates only ever fill gaps; skip the stat when nothing below would use them.
+    needs_fs_dates = (
+        dirty
+        or not (fm_created or git_created)
+        or not (fm_updated or git_updated)
+        or (status_normalized in _COMPLETION_EQUIVALENT_STATUSES and not (fm_completed or fm_updated))
+    )
+    fs_dates = file_metadata_dates(path) if needs_fs_dates else {}
+
+    fs_created = fs_dates.get("createdAt", "")
+    fs_updated = fs_dates.get("updatedAt", "")
+
+    # created/completed take the first candidate in precedence order, so stop at the first hit.
+    if fm_created:
+        created = choose_first([make_date_value(fm_created, "high", "frontmatter", "created")])
+    elif git_created:
+        created = choose_first([make_date_value(git_created, "high", "git", "first_commit")])
+    else:
+        created = choose_first([
+            make_date_value(fs_created, "medium", "filesystem", "file_birthtime"),
+            make_date_value(fs_updated, "low", "filesystem", "mtime_fallback"),
+        ])
+
+    updated_candidates: list[dict[str, str]] = []
+    if git_updated:
+        updated_candidates.append(make_date_value(git_updated, "high", "git", "latest_commit"))
+    if fm_updated:
+        updated_candidates.append(make_date_value(fm_updated, "medium", "frontmatter", "updated"))
+    if dirty and fs_updated:
+        updated_candidates.append(make_date_value(fs_updated, "high", "filesystem", "dirty_worktree"))
+    if not git_updated and not fm_updated and fs_updated:
+        updated_candidates.append(make_date_value(fs_updated, "low", "filesystem", "mtime_fallback"))
+    if fm_created:
+        updated_candidates.append(make_date_value(fm_created, "low", "frontmatter", "created_fallback"))
+    updated = choose_latest(updated_candidates)
+
+    completed: dict[str, str] = {}
+    if fm_completed:
+        completed = choose_first([make_date_value(fm_completed, "high", "frontmatter", "completed")])
+    elif status_normalized in _COMPLETION_EQUIVALENT_STATUSES:
+        completed = choose_first([
+            make_date_value(fm_updated, "medium", "frontmatter", "updated_completion_fallback"),
+            make_date_value(fs_updated, "low", "filesystem", "mtime_completion_fallback"),
+        ])
     last_activity = choose_latest([updated, completed])
 
     dates: dict[str, Any] = {}
@@ -514,19 +686,17 @@ def _normalize_task_counts(fm: dict[str, Any]) -> DocumentTaskCounts:
     tasks_raw = fm.get("tasks")
     if isinstance(tasks_raw, list) and tasks_raw:
         total = max(total, len(tasks_raw))
-        derived_completed = 0
-        derived_in_progress = 0
-        derived_blocked = 0
+        buckets = [0, 0, 0]
         for task in tasks_raw:
             if not isinstance(task, dict):
                 continue
-            status_token = str(task.get("status") or "").strip().lower()
-            if status_token in _DONE_STATUSES:
-                derived_completed += 1
-            elif status_token in _IN_PROGRESS_STATUSES:
-                derived_in_progress += 1
-            elif status_token in _BLOCKED_STATUSES:
-                derived_blocked += 1
+            status = task.get("status")
+            if not status:
+                continue
+            bucket = _TASK_STATUS_BUCKET.get(str(status).strip().lower())
+            if bucket is not None:
+                buckets[bucket] += 1
+        derived_completed, derived_in_progress, derived_blocked = buckets
         if completed == 0:
             completed = derived_completed
         if in_progress == 0:
@@ -545,7 +715,19 @@ def _normalize_task_counts(fm: dict[str, Any]) -> DocumentTaskCounts:
     )
 
 
-def _parse_phase_metadata(path: Path, fm: dict[str, Any]) -> tuple[str, int | None]:
+def _split_canonical_path(canonical_path: str) -> tuple[list[str], str]:
+    """Return ``(Path(p).parts, Path(p).stem)`` for a canonical path, via string ops when safe."""
+    segments = canonical_path.split("/")
+    if not all(segment and segment != "." for segment in segments):
+        # Absolute, empty or non-normalized paths: let pathlib apply its rules.
+        path = Path(canonical_path)
+        return list(path.parts), path.stem
+    name = segments[-1]
+    dot = name.rfind(".")
+    return segments, name[:dot] if 0 < dot < len(name) - 1 else name
+
+
+def _parse_phase_metadata(stem: str, fm: dict[str, Any]) -> tuple[str, int | None]:
     phase_token = str(
         fm.get("phase")
         or fm.get("phase_id")
@@ -553,8 +735,7 @@ def _parse_phase_metadata(path: Path, fm: dict[str, Any]) -> tuple[str, int | No
         or ""
     ).strip()
     if not phase_token:
-        stem = path.stem.lower()
-        match = re.match(r"^phase[-_ ]?(\d+)", stem)
+        match = _PHASE_RE.match(stem.lower())
         if match:
             phase_token = match.group(1)
 
@@ -564,15 +745,37 @@ def _parse_phase_metadata(path: Path, fm: dict[str, Any]) -> tuple[str, int | No
     return phase_token, phase_number
 
 
+_JSON_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
 def _json_safe(value: Any) -> Any:
-    if value is None or isinstance(value, (str, int, float, bool)):
+    """Return a JSON-safe version of ``value``, copying only the containers that change."""
+    if type(value) in _JSON_PRIMITIVE_TYPES or isinstance(value, (str, int, float, bool)):
         return value
     if isinstance(value, (date, datetime)):
         return value.isoformat()
     if isinstance(value, list):
-        return [_json_safe(v) for v in value]
+        items: list[Any] | None = None
+        for index, item in enumerate(value):
+            safe = _json_safe(item)
+            if items is None and safe is not item:
+                items = value[:index]
+            if items is not None:
+                items.append(safe)
+        if items is None:
+            return value if type(value) is list else list(value)
+        return items
     if isinstance(value, dict):
-        return {str(k): _json_safe(v) for k, v in value.items()}
+        entries: dict[str, Any] | None = None
+        for index, (key, item) in enumerate(value.items()):
+            safe = _json_safe(item)
+            if entries is None and (safe is not item or type(key) is not str):
+                entries = {str(k): v for k, v in itertools.islice(value.items(), index)}
+            if entries is not None:
+                entries[str(key)] = safe
+        if entries is None:
+            return value if type(value) is dict else dict(value)
+        return entries
     return str(value)
 
 
@@ -585,11 +788,10 @@ def parse_document_file(
 ) -> PlanDocument | None:
     """Parse a single markdown file into a PlanDocument."""
     try:
-        text = path.read_text(encoding="utf-8")
+        fm, body, had_frontmatter = _read_document(path)
     except Exception:
         return None
 
-    fm, body, had_frontmatter = _extract_frontmatter(text)
     refs = extract_frontmatter_references(fm)
 
     if project_root:
@@ -601,10 +803,10 @@ def parse_document_file(
             canonical_path = str(path).replace("\\", "/")
 
     doc_id = make_document_id(canonical_path)
-    title = str(fm.get("title") or path.stem.replace("-", " ").replace("_", " ").title())
+    title = str(fm.get("title") or path.stem.translate(_TITLE_SEPARATORS).title())
     status = str(fm.get("status") or "active")
-    status_normalized = _normalize_status(status)
-    tags = [str(v) for v in _to_string_list(fm.get("tags"))]
+    status_normalized = sys.intern(_normalize_status(status))
+    tags = _to_string_list(fm.get("tags"))
 
     created_at, updated_at, completed_at, dates, timeline = _build_document_date_fields_with_git(
         path,
@@ -621,45 +823,32 @@ def parse_document_file(
     else:
         author = str(fm.get("author", ""))
 
-    path_refs = [str(v) for v in refs.get("pathRefs", []) if isinstance(v, str)]
-    slug_refs = [str(v) for v in refs.get("slugRefs", []) if isinstance(v, str)]
-    related_refs = [str(v) for v in refs.get("relatedRefs", []) if isinstance(v, str)]
-    linked_feature_refs = [str(v) for v in refs.get("featureRefs", []) if isinstance(v, str)]
+    path_refs = _ref_strings(refs, "pathRefs")
+    slug_refs = _ref_strings(refs, "slugRefs")
+    related_refs = _ref_strings(refs, "relatedRefs")
+    linked_feature_refs = _ref_strings(refs, "featureRefs")
     typed_linked_feature_refs = _normalize_linked_feature_refs(refs.get("typedFeatureRefs"))
-    linked_session_refs = [str(v) for v in refs.get("sessionRefs", []) if isinstance(v, str)]
-    linked_task_refs = [str(v) for v in refs.get("taskRefs", []) if isinstance(v, str)]
-    prd_refs = [str(v) for v in refs.get("prdRefs", []) if isinstance(v, str)]
+    linked_session_refs = _ref_strings(refs, "sessionRefs")
+    linked_task_refs = _ref_strings(refs, "taskRefs")
+    prd_refs = _ref_strings(refs, "prdRefs")
     prd_primary = str(refs.get("prd") or "")
-    request_refs = [str(v) for v in refs.get("requestRefs", []) if isinstance(v, str)]
-    commit_refs = [str(v) for v in refs.get("commitRefs", []) if isinstance(v, str)]
-    pr_refs = [str(v) for v in refs.get("prRefs", []) if isinstance(v, str)]
-    source_document_refs = [str(v) for v in refs.get("sourceDocumentRefs", []) if isinstance(v, str)]
-    integrity_signal_refs = [str(v) for v in refs.get("integritySignalRefs", []) if isinstance(v, str)]
-    owner_refs = [str(v) for v in refs.get("ownerRefs", []) if isinstance(v, str)]
-
-    direct_commit_refs = _to_string_list(
-        fm.get("commits")
-        or fm.get("commit")
-        or fm.get("git_commit")
-        or fm.get("git_commits")
-        or fm.get("git_commit_hashes")
-    )
+    request_refs = _ref_strings(refs, "requestRefs")
+    commit_refs = _ref_strings(refs, "commitRefs")
+    pr_refs = _ref_strings(refs, "prRefs")
+    source_document_refs = _ref_strings(refs, "sourceDocumentRefs")
+    integrity_signal_refs = _ref_strings(refs, "integritySignalRefs")
+    owner_refs = _ref_strings(refs, "ownerRefs")
+
+    cfm = _canonicalize_frontmatter(fm)
+    direct_commit_refs = _to_string_list(cfm["commits"])
     all_commit_refs = sorted({*commit_refs, *direct_commit_refs})
-    prs = _to_string_list(
-        fm.get("prs")
-        or fm.get("pr")
-        or fm.get("pull_requests")
-        or fm.get("pullRequests")
-    )
+    prs = _to_string_list(cfm["prs"])
     all_pr_refs = sorted({*pr_refs, *prs})
     version = _first_string(fm.get("version"))
 
-    doc_type = classify_doc_type(canonical_path, fm)
-    doc_subtype = classify_doc_subtype(canonical_path, fm)
-    root_kind = detect_root_kind(canonical_path)
-    category = classify_doc_category(canonical_path, fm)
-    path_segments = list(Path(canonical_path).parts)
-    phase_token, phase_number = _parse_phase_metadata(Path(canonical_path), fm)
+    doc_type, doc_subtype, root_kind, category = _classify_document(canonical_path, fm)
+    path_segments, path_stem = _split_canonical_path(canonical_path)
+    phase_token, phase_number = _parse_phase_metadata(path_stem, fm)
     task_counts = _normalize_task_counts(fm)
     doc_type_fields = _extract_doc_type_fields(doc_type, fm)
 
@@ -700,18 +889,10 @@ def parse_document_file(
     )
     primary_doc_role = _first_non_empty(fm.get("primary_doc_role"))
 
-    frontmatter_type = str(fm.get("type") or fm.get("doc_type") or fm.get("doctype") or "").strip()
+    frontmatter_type = str(cfm["type"] or "").strip()
 
-    feature_slug = _normalize_feature_identity(
-        fm.get("feature_slug")
-        or fm.get("feature")
-        or fm.get("feature_id")
-        or fm.get("feature_slug_hint")
-    )
-    feature_family = _normalize_feature_identity(
-        fm.get("feature_family") or fm.get("lineage_family"),
-        canonicalize=True,
-    )
+    feature_slug = _normalize_feature_identity(cfm["feature_slug"])
+    feature_family = _normalize_feature_identity(cfm["feature_family"], canonicalize=True)
     blocked_by = _normalize_feature_ref_list(_to_string_list(fm.get("blocked_by")))
     if blocked_by:
         existing_relation_keys = {
@@ -753,27 +934,10 @@ def parse_document_file(
                 break
     feature_slug_canonical = canonical_slug(feature_slug_hint) if feature_slug_hint else ""
 
-    lineage_family_raw = _first_string(fm.get("lineage_family") or fm.get("feature_family"))
-    lineage_parent_raw = _first_string(
-        fm.get("lineage_parent")
-        or fm.get("parent_feature")
-        or fm.get("parent_feature_slug")
-        or fm.get("extends_feature")
-        or fm.get("derived_from")
-        or fm.get("supersedes")
-    )
-    lineage_children_raw = _to_string_list(
-        fm.get("lineage_children")
-        or fm.get("child_features")
-        or fm.get("superseded_by")
-    )
-    lineage_type = str(
-        _first_string(
-            fm.get("lineage_type")
-            or fm.get("lineage_relationship")
-            or fm.get("feature_lineage_type")
-        )
-    ).strip().lower().replace(" ", "_")
+    lineage_family_raw = _first_string(cfm["lineage_family"])
+    lineage_parent_raw = _first_string(cfm["lineage_parent"])
+    lineage_children_raw = _to_string_list(cfm["lineage_children"])
+    lineage_type = str(_first_string(cfm["lineage_type"])).strip().lower().replace(" ", "_")
     lineage_parent = _normalize_feature_ref(lineage_parent_raw)
     lineage_children = _normalize_feature_ref_list(lineage_children_raw)
     normalized_lineage_family = _normalize_feature_ref(lineage_family_raw)
@@ -781,37 +945,32 @@ def parse_document_file(
         normalized_lineage_family or feature_family or feature_slug_hint or feature_slug_canonical
     )
 
-    all_linked_feature_refs = sorted(
-        {
-            *linked_feature_refs,
-            *[str(ref.get("feature") or "") for ref in typed_linked_feature_refs],
-            *blocked_by,
-            *([lineage_parent] if lineage_parent else []),
-            *lineage_children,
-        }
-    )
-    if feature_slug:
-        all_linked_feature_refs = sorted({*all_linked_feature_refs, feature_slug})
-
-    feature_candidates = sorted(
-        {
-            *all_linked_feature_refs,
-            *alias_tokens_from_path(canonical_path),
-            *( [feature_slug_hint] if feature_slug_hint else [] ),
-            *( [feature_slug_canonical] if feature_slug_canonical else [] ),
-            *( [lineage_family] if lineage_family else [] ),
-        }
-    )
+    linked_feature_set = {
+        *linked_feature_refs,
+        *(str(ref.get("feature") or "") for ref in typed_linked_feature_refs),
+        *blocked_by,
+        *lineage_children,
+    }
+    for ref in (lineage_parent, feature_slug):
+        if ref:
+            linked_feature_set.add(ref)
+    all_linked_feature_refs = sorted(linked_feature_set)
+
+    candidate_set = {*linked_feature_set, *_path_alias_tokens(canonical_path)}
+    for candidate in (feature_slug_hint, feature_slug_canonical, lineage_family):
+        if candidate:
+            candidate_set.add(candidate)
+    feature_candidates = sorted(candidate_set)
 
     contributors = [str(v) for v in _to_string_list(fm.get("contributors"))]
     reviewers = [str(v) for v in _to_string_list(fm.get("reviewers"))]
     approvers = [str(v) for v in _to_string_list(fm.get("approvers"))]
     audience_values = [str(v) for v in _to_string_list(fm.get("audience"))]
-    labels = sorted({*tags, *[str(v) for v in _to_string_list(fm.get("labels"))]})
-    files_affected = [str(v) for v in _to_string_list(fm.get("files_affected") or fm.get("filesAffected"))]
-    files_modified = [str(v) for v in _to_string_list(fm.get("files_modified") or fm.get("filesModified"))]
-    context_files = [str(v) for v in _to_string_list(fm.get("context_files") or fm.get("contextFiles"))]
-    owners = sorted({*owner_refs, *[str(v) for v in _to_string_list(fm.get("owner") or fm.get("owners"))]})
+    labels = sorted({*tags, *_to_string_list(fm.get("labels"))})
+    files_affected = [str(v) for v in _to_string_list(cfm["files_affected"])]
+    files_modified = [str(v) for v in _to_string_list(cfm["files_modified"])]
+    context_files = [str(v) for v in _to_string_list(cfm["context_files"])]
+    owners = sorted({*owner_refs, *_to_string_list(cfm["owners"])})
     contributors = sorted({*contributors, *owner_refs})
     source_document_refs = sorted({*source_document_refs, *_to_string_list(fm.get("source_documents"))})
     integrity_signal_refs = sorted({*integrity_signal_refs, *_to_string_list(fm.get("integrity_signal_refs"))})
@@ -949,13 +1108,13 @@ def parse_document_file(
             filesModified=files_modified,
             contextFiles=context_files,
             integritySignalRefs=integrity_signal_refs,
-            fieldKeys=sorted(str(key) for key in fm.keys()),
-            raw=_json_safe({str(k): v for k, v in fm.items()}),
+            fieldKeys=sorted(key if type(key) is str else str(key) for key in fm),
+            raw=_json_safe(fm),
         ),
         metadata=metadata,
         dates=dates,
         timeline=timeline,
-        content=body[:5000] if body else None,
+        content=body or None,
     )
 
 
@@ -965,10 +1124,8 @@ def scan_documents(documents_dir: Path, project_root: Path | None = None) -> lis
     if not documents_dir.exists():
         return docs
 
-    for path in sorted(documents_dir.rglob("*.md")):
-        if path.name.startswith("."):
-            continue
-        doc = parse_document_file(path, documents_dir, project_root=project_root)
+    for entry in sorted_markdown_entries(str(documents_dir)):
+        doc = parse_document_file(Path(entry.path), documents_dir, project_root=project_root)
         if doc:
             docs.append(doc)
 
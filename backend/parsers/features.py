@@ -5,13 +5,22 @@ Scan Implementation Plans → PRDs → Progress dirs and merge into Feature obje
 from __future__ import annotations
 
 import errno
+import functools
 import logging
+import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Optional
 
 import yaml
 
+try:  # libyaml-backed loader is several times faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 from backend import config
 from backend.models import (
     EntityDates,
@@ -45,6 +54,7 @@ from backend.document_linking import (
     normalize_doc_status,
     normalize_ref_path,
 )
+from backend.parsers._walk import sorted_markdown_entries
 from backend.parsers.status_writer import FrontmatterParseError, update_frontmatter_field
 from backend.date_utils import (
     choose_earliest,
@@ -152,9 +162,16 @@ _TASK_STATUS_MAP = {
 }
 
 
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_UNDERSCORE_RUN_RE = re.compile(r"_+")
+_FIRST_INT_RE = re.compile(r"(\d+)")
+_EFFORT_RE = re.compile(r"(\d+(?:\.\d+)?)")
+
+
+@functools.lru_cache(maxsize=4096)
 def _normalize_status_token(raw: str) -> str:
-    token = re.sub(r"[^a-z0-9]+", "_", (raw or "").strip().lower())
-    return re.sub(r"_+", "_", token).strip("_")
+    # "_" is itself non-alphanumeric, so one substitution already collapses runs.
+    return _NON_ALNUM_RE.sub("_", (raw or "").strip().lower()).strip("_")
 
 
 def _map_status(raw: str) -> str:
@@ -172,16 +189,83 @@ def _is_completion_equivalent_doc_status(raw: str) -> bool:
 
 # ── Frontmatter extraction ──────────────────────────────────────────
 
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---", re.DOTALL)
+
+
 def _extract_frontmatter(text: str) -> dict:
-    match = re.match(r"^---\s*\n(.*?)\n---", text, re.DOTALL)
+    if not text.startswith("---"):
+        return {}
+    match = _FRONTMATTER_RE.match(text)
     if not match:
         return {}
     try:
-        return yaml.safe_load(match.group(1)) or {}
+        return yaml.load(match.group(1), Loader=_YamlLoader) or {}
     except yaml.YAMLError:
         return {}
 
 
+# Parsed frontmatter keyed by path; entries are reused while the file signature matches.
+_FRONTMATTER_CACHE: dict[str, tuple[tuple[int, int, int, int], Any]] = {}
+_FRONTMATTER_CACHE_MAX = 20000
+# Files modified this recently are not cached: a same-size edit inside the filesystem's
+# timestamp granularity (2s on FAT, coarse on some mounts) would leave the signature unchanged.
+_FRONTMATTER_RACY_NS = 2_000_000_000
+# Characters read up front; the rest of the file is only read when frontmatter is not closed by then.
+_FRONTMATTER_READ_CHARS = 16 * 1024
+
+
+def _read_frontmatter_cached(path: Path, stat_result: os.stat_result | None = None) -> Any:
+    """Read and parse ``path`` frontmatter, reusing the last result while the file is unchanged.
+
+    Recently modified files are always re-read; see ``_FRONTMATTER_RACY_NS``.
+
+    Only the head of the file is read unless the frontmatter block runs past it.
+    ``stat_result`` may carry a stat already taken during a directory walk.
+    Read errors propagate like ``read_text``. The returned value is shared, so
+    callers must treat it as read-only.
+    """
+    key = str(path)
+    st = stat_result if stat_result is not None else os.stat(key)
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino, st.st_ctime_ns)
+    cached = _FRONTMATTER_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    with open(key, encoding="utf-8") as handle:
+        text = handle.read(_FRONTMATTER_READ_CHARS)
+        if len(text) == _FRONTMATTER_READ_CHARS and text.startswith("---") and not _FRONTMATTER_RE.match(text):
+            text += handle.read()
+    fm = _extract_frontmatter(text)
+    if st.st_mtime_ns > time.time_ns() - _FRONTMATTER_RACY_NS:
+        _FRONTMATTER_CACHE.pop(key, None)
+        return fm
+    if len(_FRONTMATTER_CACHE) >= _FRONTMATTER_CACHE_MAX:
+        _FRONTMATTER_CACHE.clear()
+    _FRONTMATTER_CACHE[key] = (signature, fm)
+    return fm
+
+
+# Scans over at least this many files warm the frontmatter cache from a thread pool first.
+_PREFETCH_MIN_FILES = 32
+_PREFETCH_MAX_WORKERS = 16
+
+
+def _warm_frontmatter(file: tuple[Path, os.stat_result | None]) -> None:
+    try:
+        _read_frontmatter_cached(*file)
+    except Exception:  # noqa: BLE001 - the scan loop re-reads the file and reports the failure
+        pass
+
+
+def _prefetch_frontmatter(files: list[tuple[Path, os.stat_result | None]]) -> None:
+    """Populate the frontmatter cache for ``(path, stat)`` pairs concurrently so file reads overlap."""
+    if len(files) < _PREFETCH_MIN_FILES:
+        return
+    workers = min((os.cpu_count() or 1) * 4, _PREFETCH_MAX_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for _ in executor.map(_warm_frontmatter, files):
+            pass
+
+
 def _to_string_list(value: Any) -> list[str]:
     if isinstance(value, str):
         text = value.strip()
@@ -199,6 +283,7 @@ def _to_string_list(value: Any) -> list[str]:
     return []
 
 
+@functools.lru_cache(maxsize=4096)
 def _normalize_feature_ref(value: str) -> str:
     raw = (value or "").strip()
     if not raw:
@@ -270,7 +355,7 @@ def _normalize_linked_feature_refs(raw: Any) -> list[dict[str, Any]]:
 
 def _normalize_choice_token(raw: Any) -> str:
     token = str(raw or "").strip().lower().replace("-", "_").replace(" ", "_")
-    return re.sub(r"_+", "_", token).strip("_")
+    return _UNDERSCORE_RUN_RE.sub("_", token).strip("_")
 
 
 def _to_optional_int(value: Any) -> int | None:
@@ -341,7 +426,7 @@ def _make_status_evidence(
 
 
 def _batch_sort_key(batch_id: str) -> tuple[int, str]:
-    match = re.search(r"(\d+)", str(batch_id or ""))
+    match = _FIRST_INT_RE.search(str(batch_id or ""))
     if match:
         return (int(match.group(1)), str(batch_id or ""))
     return (10_000, str(batch_id or ""))
@@ -403,6 +488,34 @@ def _base_slug(slug: str) -> str:
     return canonical_slug(slug)
 
 
+def _sorted_markdown_paths(root: Path) -> list[Path]:
+    """Return non-hidden ``.md`` files below ``root`` in ``sorted(root.rglob("*.md"))`` order."""
+    return [Path(entry.path) for entry in sorted_markdown_entries(str(root))]
+
+
+def _entry_stat(entry: os.DirEntry) -> os.stat_result | None:
+    try:
+        return entry.stat()
+    except OSError:
+        return None
+
+
+def _sorted_markdown_files(root: Path) -> list[tuple[Path, os.stat_result | None]]:
+    """Like ``_sorted_markdown_paths`` but pairs each path with its directory-entry stat."""
+    return [(Path(entry.path), _entry_stat(entry)) for entry in sorted_markdown_entries(str(root))]
+
+
+def _dir_markdown_files(directory: Path) -> list[tuple[Path, os.stat_result | None]]:
+    """Return ``(path, stat)`` for ``directory``'s ``*.md`` entries in ``sorted(directory.glob("*.md"))`` order."""
+    try:
+        with os.scandir(directory) as it:
+            entries = [entry for entry in it if entry.name.endswith(".md")]
+    except OSError:
+        return []
+    entries.sort(key=lambda e: e.name)
+    return [(Path(entry.path), _entry_stat(entry)) for entry in entries]
+
+
 def _project_relative(path: Path, project_root: Path) -> str:
     return canonical_project_path(path, project_root)
 
@@ -413,6 +526,7 @@ def _extract_doc_metadata(
     frontmatter: dict[str, Any],
     git_date_index: dict[str, dict[str, str]] | None = None,
     dirty_paths: set[str] | None = None,
+    stat_result: os.stat_result | None = None,
 ) -> dict[str, Any]:
     project_rel = _project_relative(path, project_root)
     refs = extract_frontmatter_references(frontmatter)
@@ -445,7 +559,7 @@ def _extract_doc_metadata(
     lineage_family = canonical_slug(
         _normalize_feature_ref(lineage_family_raw) or _normalize_feature_ref(str(frontmatter.get("feature_slug") or ""))
     )
-    fs_dates = file_metadata_dates(path)
+    fs_dates = file_metadata_dates(path, stat_result)
     git_dates: dict[str, str] = {}
     dirty = False
     if isinstance(git_date_index, dict):
@@ -590,21 +704,21 @@ def _scan_impl_plans(
     if not impl_dir.exists():
         return plans
 
-    for path in sorted(impl_dir.rglob("*.md")):
-        if path.name.startswith(".") or path.name == "README.md":
+    files = _sorted_markdown_files(impl_dir)
+    _prefetch_frontmatter(files)
+    for path, stat_result in files:
+        if path.name == "README.md":
             continue
         # Skip summary/index files
         if "SUMMARY" in path.name.upper():
             continue
 
         try:
-            text = path.read_text(encoding="utf-8")
+            fm = _read_frontmatter_cached(path, stat_result)
         except Exception:
             logger.warning("features-parser: failed to read impl-plan file %s", path)
             _record_parser_failure("impl_plan", project_id="unknown")
             continue
-
-        fm = _extract_frontmatter(text)
         if not fm:
             continue
 
@@ -616,7 +730,14 @@ def _scan_impl_plans(
         tags = fm.get("tags", [])
         if isinstance(tags, str):
             tags = [tags]
-        doc_meta = _extract_doc_metadata(path, project_root, fm, git_date_index=git_date_index, dirty_paths=dirty_paths)
+        doc_meta = _extract_doc_metadata(
+            path,
+            project_root,
+            fm,
+            git_date_index=git_date_index,
+            dirty_paths=dirty_paths,
+            stat_result=stat_result,
+        )
         rel_path = doc_meta["file_path"]
         updated = str(doc_meta.get("updated_at") or "")
 
@@ -702,18 +823,18 @@ def _scan_prds(
     if not prd_dir.exists():
         return prds
 
-    for path in sorted(prd_dir.rglob("*.md")):
-        if path.name.startswith(".") or path.name == "README.md":
+    files = _sorted_markdown_files(prd_dir)
+    _prefetch_frontmatter(files)
+    for path, stat_result in files:
+        if path.name == "README.md":
             continue
 
         try:
-            text = path.read_text(encoding="utf-8")
+            fm = _read_frontmatter_cached(path, stat_result)
         except Exception:
             logger.warning("features-parser: failed to read PRD file %s", path)
             _record_parser_failure("prd", project_id="unknown")
             continue
-
-        fm = _extract_frontmatter(text)
         if not fm:
             continue
 
@@ -725,7 +846,14 @@ def _scan_prds(
         tags = fm.get("tags", [])
         if isinstance(tags, str):
             tags = [tags]
-        doc_meta = _extract_doc_metadata(path, project_root, fm, git_date_index=git_date_index, dirty_paths=dirty_paths)
+        doc_meta = _extract_doc_metadata(
+            path,
+            project_root,
+            fm,
+            git_date_index=git_date_index,
+            dirty_paths=dirty_paths,
+            stat_result=stat_result,
+        )
         rel_path = doc_meta["file_path"]
         updated = str(doc_meta.get("updated_at") or "")
 
@@ -781,7 +909,7 @@ def _parse_progress_tasks(tasks_raw: list, source_file: str = "") -> list[Projec
         # Rough cost from effort
         effort_str = str(t.get("estimated_effort", t.get("story_points", "")))
         cost = 0.0
-        m = re.search(r"(\d+(?:\.\d+)?)", effort_str)
+        m = _EFFORT_RE.search(effort_str)
         if m:
             cost = float(m.group(1)) * 0.50
 
@@ -1031,10 +1159,13 @@ def _scan_progress_dirs(
     if not progress_dir.exists():
         return progress_data
 
-    for subdir in sorted(progress_dir.iterdir()):
-        if not subdir.is_dir() or subdir.name.startswith("."):
-            continue
+    subdirs = [d for d in sorted(progress_dir.iterdir()) if d.is_dir() and not d.name.startswith(".")]
+    md_files_by_dir = {subdir: _dir_markdown_files(subdir) for subdir in subdirs}
+    _prefetch_frontmatter(
+        [file for md_files in md_files_by_dir.values() for file in md_files if not file[0].name.startswith(".")]
+    )
 
+    for subdir in subdirs:
         slug = subdir.name.lower()
         phases: list[FeaturePhase] = []
         overall_status = "backlog"
@@ -1042,18 +1173,16 @@ def _scan_progress_dirs(
         progress_docs: list[dict[str, Any]] = []
 
         # Find all markdown files in this progress dir
-        for md_file in sorted(subdir.glob("*.md")):
+        for md_file, stat_result in md_files_by_dir[subdir]:
             if md_file.name.startswith("."):
                 continue
 
             try:
-                text = md_file.read_text(encoding="utf-8")
+                fm = _read_frontmatter_cached(md_file, stat_result)
             except Exception:
                 logger.warning("features-parser: failed to read progress file %s", md_file)
                 _record_parser_failure("progress", project_id="unknown")
                 continue
-
-            fm = _extract_frontmatter(text)
             if not fm:
                 continue
 
@@ -1075,7 +1204,14 @@ def _scan_progress_dirs(
             if not isinstance(deferred, int):
                 deferred = 0
 
-            doc_meta = _extract_doc_metadata(md_file, project_root, fm, git_date_index=git_date_index, dirty_paths=dirty_paths)
+            doc_meta = _extract_doc_metadata(
+                md_file,
+                project_root,
+                fm,
+                git_date_index=git_date_index,
+                dirty_paths=dirty_paths,
+                stat_result=stat_result,
+            )
             updated = str(doc_meta.get("updated_at") or "")
             if updated and updated > latest_updated:
                 latest_updated = updated
@@ -1192,9 +1328,9 @@ def _scan_progress_dirs(
         }
 
         # Extract prd slug from the first file that has one
-        for md_file in sorted(subdir.glob("*.md")):
+        for md_file, stat_result in md_files_by_dir[subdir]:
             try:
-                fm = _extract_frontmatter(md_file.read_text(encoding="utf-8"))
+                fm = _read_frontmatter_cached(md_file, stat_result)
                 prd_val = fm.get("prd", "")
                 if prd_val:
                     progress_data[slug]["prd_slug"] = str(prd_val).lower()
@@ -1210,6 +1346,57 @@ def _scan_progress_dirs(
 # ── File resolution helpers (for status write-back) ────────────────
 
 
+def _dir_tree_marker(root: str) -> tuple[int, ...]:
+    """Return the ``st_mtime_ns`` of ``root`` and every directory below it, in walk order.
+
+    Adding, removing or renaming an entry updates its parent directory's mtime, so
+    an unchanged marker means the set of files in the tree is unchanged. Symlinked
+    directories are not descended into, matching ``sorted_markdown_entries``.
+    """
+    marker: list[int] = []
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as it:
+                marker.append(os.stat(directory).st_mtime_ns)
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            marker.append(-1)
+    return tuple(marker)
+
+
+@functools.lru_cache(maxsize=32)
+def _slug_index(root: str, marker: tuple[int, ...]) -> tuple[dict[str, Path], dict[str, Path]]:
+    """Map slugs and base slugs to the first matching ``.md`` file below ``root``.
+
+    ``marker`` is the ``_dir_tree_marker`` of ``root``; it only keys the cache.
+    """
+    exact: dict[str, Path] = {}
+    base: dict[str, Path] = {}
+    for path in _sorted_markdown_paths(Path(root)):
+        slug = _slug_from_path(path)
+        exact.setdefault(slug, path)
+        base.setdefault(_base_slug(slug), path)
+    return exact, base
+
+
+def _find_by_slug(root: Path, feature_id: str) -> Optional[Path]:
+    key = str(root)
+    marker = _dir_tree_marker(key)
+    if max(marker) > time.time_ns() - _FRONTMATTER_RACY_NS:
+        # A directory changed within the timestamp granularity; its mtime may not move again.
+        exact, base = _slug_index.__wrapped__(key, marker)
+    else:
+        exact, base = _slug_index(key, marker)
+    return exact.get(feature_id) or base.get(_base_slug(feature_id))
+
+
 def resolve_file_for_feature(
     feature_id: str, docs_dir: Path, progress_dir: Path
 ) -> Optional[Path]:
@@ -1217,16 +1404,16 @@ def resolve_file_for_feature(
     # Check PRDs
     prd_dir = docs_dir / "PRDs"
     if prd_dir.exists():
-        for path in prd_dir.rglob("*.md"):
-            if _slug_from_path(path) == feature_id or _base_slug(_slug_from_path(path)) == _base_slug(feature_id):
-                return path
+        path = _find_by_slug(prd_dir, feature_id)
+        if path is not None:
+            return path
 
     # Check impl plans
     impl_dir = docs_dir / "implementation_plans"
     if impl_dir.exists():
-        for path in impl_dir.rglob("*.md"):
-            if _slug_from_path(path) == feature_id or _base_slug(_slug_from_path(path)) == _base_slug(feature_id):
-                return path
+        path = _find_by_slug(impl_dir, feature_id)
+        if path is not None:
+            return path
 
     return None
 
@@ -1247,8 +1434,7 @@ def resolve_file_for_phase(
 
     for md_file in sorted(subdir.glob("*.md")):
         try:
-            text = md_file.read_text(encoding="utf-8")
-            fm = _extract_frontmatter(text)
+            fm = _read_frontmatter_cached(md_file)
             if str(fm.get("phase", "all")) == phase_id:
                 return md_file
         except Exception:
@@ -1302,17 +1488,25 @@ def _scan_auxiliary_docs(
     for root in roots:
         if not root.exists():
             continue
-        for path in sorted(root.rglob("*.md")):
-            if path.name.startswith(".") or path.name == "README.md":
+        files = _sorted_markdown_files(root)
+        _prefetch_frontmatter(files)
+        for path, stat_result in files:
+            if path.name == "README.md":
                 continue
             try:
-                text = path.read_text(encoding="utf-8")
+                fm = _read_frontmatter_cached(path, stat_result)
             except Exception:
                 logger.warning("features-parser: failed to read document file %s", path)
                 _record_parser_failure("document_catalog", project_id="unknown")
                 continue
-            fm = _extract_frontmatter(text)
-            metadata = _extract_doc_metadata(path, project_root, fm, git_date_index=git_date_index, dirty_paths=dirty_paths)
+            metadata = _extract_doc_metadata(
+                path,
+                project_root,
+                fm,
+                git_date_index=git_date_index,
+                dirty_paths=dirty_paths,
+                stat_result=stat_result,
+            )
             file_path = str(metadata["file_path"])
             if not file_path or file_path in seen_paths:
                 continue
@@ -1616,8 +1810,7 @@ def _load_doc_frontmatter(
         return {}
 
     try:
-        text = absolute.read_text(encoding="utf-8")
-        frontmatter = _extract_frontmatter(text)
+        frontmatter = _read_frontmatter_cached(absolute)
     except Exception:
         frontmatter = {}
 
@@ -2162,8 +2355,7 @@ def _read_frontmatter_status_cached(
     absolute_path = project_root / normalized
     status_value = ""
     try:
-        text = absolute_path.read_text(encoding="utf-8")
-        fm = _extract_frontmatter(text)
+        fm = _read_frontmatter_cached(absolute_path)
         status_value = str(fm.get("status") or "")
     except Exception:
         status_value = ""
@@ -2246,6 +2438,7 @@ def _reconcile_completion_equivalence(
                 continue
             try:
                 update_frontmatter_field(absolute_path, "status", _INFERRED_COMPLETE_STATUS)
+                _FRONTMATTER_CACHE.pop(str(absolute_path), None)
                 status_cache[normalized] = _INFERRED_COMPLETE_STATUS
                 write_updates += 1
             except FrontmatterParseError as exc:
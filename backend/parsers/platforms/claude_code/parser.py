@@ -31,6 +31,7 @@ from backend.parsers.platforms.test_runs import (
     parse_test_run_from_command,
 )
 from backend.parsers.capture_sidecar import parse_capture_sidecar
+from backend.parsers.platforms.jsonl import decode_jsonl_lines
 from backend.parsers.session_name_provenance import (
     SESSION_NAME_FALLBACK_TRUNCATION_LEN,
     SESSION_NAME_SOURCE_DERIVED_DETERMINISTIC,
@@ -1916,16 +1917,7 @@ def parse_session_file(path: Path) -> AgentSession | None:
     if not lines:
         return None
 
-    entries = []
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            entries.append(json.loads(line))
-        except json.JSONDecodeError:
-            continue
-
+    entries = decode_jsonl_lines(lines)
     if not entries:
         return None
 
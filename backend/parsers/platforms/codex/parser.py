@@ -22,6 +22,7 @@ from backend.parsers.session_name_provenance import (
     SESSION_NAME_SOURCE_PROVIDER_PERSISTED,
 )
 from backend.parsers.platforms.codex.tool_outcome import classify_tool_outcome
+from backend.parsers.platforms.jsonl import decode_jsonl_lines
 from backend.parsers.platforms.test_runs import (
     aggregate_test_runs,
     enrich_test_run_with_output,
@@ -464,17 +465,9 @@ def parse_session_file(path: Path) -> AgentSession | None:
     if not lines:
         return None
 
-    entries: list[dict[str, Any]] = []
-    for raw_line in lines:
-        line = raw_line.strip()
-        if not line:
-            continue
-        try:
-            parsed = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if isinstance(parsed, dict):
-            entries.append(parsed)
+    entries: list[dict[str, Any]] = [
+        parsed for parsed in decode_jsonl_lines(lines) if isinstance(parsed, dict)
+    ]
     if not entries:
         return None
     if not _looks_like_codex(path, entries):
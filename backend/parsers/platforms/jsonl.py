@@ -0,0 +1,37 @@
+"""Shared JSONL line decoding for platform session parsers."""
+from __future__ import annotations
+
+import json
+from typing import Any, Iterable
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - msgspec is an optional accelerator
+    msgspec = None  # type: ignore[assignment]
+
+_fast_decode = msgspec.json.Decoder().decode if msgspec is not None else None
+
+
+def _decode_line(line: str) -> Any:
+    if _fast_decode is not None:
+        try:
+            return _fast_decode(line)
+        except msgspec.DecodeError:
+            # msgspec is stricter than json (NaN literals, >64-bit ints); let
+            # the stdlib decide so accepted input matches the legacy parser.
+            pass
+    return json.loads(line)
+
+
+def decode_jsonl_lines(lines: Iterable[str]) -> list[Any]:
+    """Decode each non-blank line as JSON, skipping lines that fail to parse."""
+    entries: list[Any] = []
+    for raw_line in lines:
+        line = raw_line.strip()
+        if not line:
+            continue
+        try:
+            entries.append(_decode_line(line))
+        except json.JSONDecodeError:
+            continue
+    return entries
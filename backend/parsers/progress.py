@@ -6,6 +6,11 @@ from pathlib import Path
 
 import yaml
 
+try:  # libyaml-backed loader is several times faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 from backend.models import ProjectTask
 
 
@@ -38,13 +43,20 @@ _MODEL_MAP = {
 }
 
 
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---", re.DOTALL)
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_EFFORT_RE = re.compile(r"(\d+(?:\.\d+)?)")
+
+
 def _extract_frontmatter(text: str) -> dict:
     """Extract YAML frontmatter from a markdown file."""
-    match = re.match(r"^---\s*\n(.*?)\n---", text, re.DOTALL)
+    if not text.startswith("---"):
+        return {}
+    match = _FRONTMATTER_RE.match(text)
     if not match:
         return {}
     try:
-        return yaml.safe_load(match.group(1)) or {}
+        return yaml.load(match.group(1), Loader=_YamlLoader) or {}
     except yaml.YAMLError:
         return {}
 
@@ -96,7 +108,7 @@ def _normalize_batch_task_map(parallelization: object) -> dict[str, str]:
 
 def _normalize_raw_status_tag(prefix: str, raw_status: object) -> str:
     token = str(raw_status or "").strip().lower()
-    token = re.sub(r"[^a-z0-9]+", "-", token).strip("-")
+    token = _NON_ALNUM_RE.sub("-", token).strip("-")
     return f"{prefix}:{token}" if token else ""
 
 
@@ -178,8 +190,7 @@ def parse_progress_file(path: Path, base_dir: Path) -> list[ProjectTask]:
         effort_str = str(task_raw.get("estimated_effort", ""))
         cost = 0.0
         # Parse "2h" or "3 pts" into a numeric value
-        import re as _re
-        effort_match = _re.search(r"(\d+(?:\.\d+)?)", effort_str)
+        effort_match = _EFFORT_RE.search(effort_str)
         if effort_match:
             cost = float(effort_match.group(1)) * 0.50  # rough cost: $0.50/unit
 
@@ -661,7 +661,7 @@ async def list_sessions(
     """
     project = resolve_project(request_context, core_ports, requested_project_id=project_id)
     if not project:
-        return PaginatedResponse(items=[], total=0, offset=offset, limit=limit)
+        return PaginatedResponse[AgentSession](items=[], total=0, offset=offset, limit=limit)
 
     repo = core_ports.storage.sessions()
     mappings = await load_session_mappings(core_ports.storage.db, project.id)
@@ -977,7 +977,7 @@ async def list_sessions(
                 exc,
             )
 
-    return PaginatedResponse(
+    return PaginatedResponse[AgentSession](
         items=results,
         total=total_count,
         offset=offset,
@@ -1810,7 +1810,7 @@ def _map_document_row_to_model(row: dict, include_content: bool = False, link_co
         "contextFiles": _string_list(fm.get("contextFiles")),
         "integritySignalRefs": _string_list(fm.get("integritySignalRefs")),
         "fieldKeys": _string_list(fm.get("fieldKeys")),
-        "raw": fm.get("raw") if isinstance(fm.get("raw"), dict) else fm,
+        "raw": (fm.get("raw") if isinstance(fm.get("raw"), dict) else fm) if include_content else None,
     }
 
     raw_status_normalized = str(row.get("status_normalized") or row.get("status") or "")
@@ -2188,7 +2188,7 @@ async def list_tasks(
     """Return paginated tasks from DB."""
     project = resolve_project(request_context, core_ports)
     if not project:
-        return PaginatedResponse(items=[], total=0, offset=offset, limit=limit)
+        return PaginatedResponse[ProjectTask](items=[], total=0, offset=offset, limit=limit)
 
     repo = core_ports.storage.tasks()
     tasks = await repo.list_paginated(project.id, offset, limit, workspace_id="default-local")  # TODO(workspace-routing)
@@ -2217,4 +2217,4 @@ async def list_tasks(
             sessionId=t["session_id"],
             commitHash=t["commit_hash"],
         ))
-    return PaginatedResponse(items=results, total=total, offset=offset, limit=limit)
+    return PaginatedResponse[ProjectTask](items=results, total=total, offset=offset, limit=limit)
@@ -863,7 +863,7 @@ async def list_features(
     _obs_started = _time_mod.monotonic()
     project = project_manager.get_active_project()
     if not project:
-        return PaginatedResponse(items=[], total=0, offset=offset, limit=limit)
+        return PaginatedResponse[Feature](items=[], total=0, offset=offset, limit=limit)
 
     # ── P2-016: server-side cache check ────────────────────────────────────
     from backend import config as _cfg  # noqa: PLC0415 — lazy to avoid import-order issues
@@ -989,7 +989,7 @@ async def list_features(
         except Exception:
             logger.exception("Failed to derive dependency/family state for feature list")
 
-    response = PaginatedResponse(items=results, total=total, offset=offset, limit=limit)
+    response = PaginatedResponse[Feature](items=results, total=total, offset=offset, limit=limit)
 
     # ── P2-016: store result in cache ───────────────────────────────────────
     if _cfg.CCDASH_QUERY_CACHE_TTL_SECONDS > 0:
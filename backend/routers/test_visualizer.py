@@ -295,23 +295,25 @@ def _page(items: list[Any], *, offset: int, limit: int, total: int) -> tuple[lis
 
 
 def _to_test_run_dto(row: dict[str, Any]) -> TestRunDTO:
-    return TestRunDTO(
-        run_id=str(row.get("run_id") or ""),
-        project_id=str(row.get("project_id") or ""),
-        timestamp=str(row.get("timestamp") or ""),
-        git_sha=str(row.get("git_sha") or ""),
-        branch=str(row.get("branch") or ""),
-        agent_session_id=str(row.get("agent_session_id") or ""),
-        env_fingerprint=str(row.get("env_fingerprint") or ""),
-        trigger=str(row.get("trigger") or "local"),
-        status=str(row.get("status") or "complete"),
-        total_tests=int(row.get("total_tests") or 0),
-        passed_tests=int(row.get("passed_tests") or 0),
-        failed_tests=int(row.get("failed_tests") or 0),
-        skipped_tests=int(row.get("skipped_tests") or 0),
-        duration_ms=int(row.get("duration_ms") or 0),
-        metadata=row.get("metadata_json", {}) if isinstance(row.get("metadata_json", {}), dict) else {},
-        created_at=str(row.get("created_at") or ""),
+    return TestRunDTO.from_row(
+        {
+            "run_id": str(row.get("run_id") or ""),
+            "project_id": str(row.get("project_id") or ""),
+            "timestamp": str(row.get("timestamp") or ""),
+            "git_sha": str(row.get("git_sha") or ""),
+            "branch": str(row.get("branch") or ""),
+            "agent_session_id": str(row.get("agent_session_id") or ""),
+            "env_fingerprint": str(row.get("env_fingerprint") or ""),
+            "trigger": str(row.get("trigger") or "local"),
+            "status": str(row.get("status") or "complete"),
+            "total_tests": int(row.get("total_tests") or 0),
+            "passed_tests": int(row.get("passed_tests") or 0),
+            "failed_tests": int(row.get("failed_tests") or 0),
+            "skipped_tests": int(row.get("skipped_tests") or 0),
+            "duration_ms": int(row.get("duration_ms") or 0),
+            "metadata": row.get("metadata_json", {}) if isinstance(row.get("metadata_json", {}), dict) else {},
+            "created_at": str(row.get("created_at") or ""),
+        }
     )
 
 
@@ -319,17 +321,19 @@ def _to_test_result_dto(row: dict[str, Any]) -> TestResultDTO:
     refs = row.get("artifact_refs_json", [])
     if not isinstance(refs, list):
         refs = []
-    return TestResultDTO(
-        run_id=str(row.get("run_id") or ""),
-        test_id=str(row.get("test_id") or ""),
-        status=str(row.get("status") or ""),
-        duration_ms=int(row.get("duration_ms") or 0),
-        error_fingerprint=str(row.get("error_fingerprint") or ""),
-        error_message=str(row.get("error_message") or ""),
-        artifact_refs=[str(item) for item in refs if str(item).strip()],
-        stdout_ref=str(row.get("stdout_ref") or ""),
-        stderr_ref=str(row.get("stderr_ref") or ""),
-        created_at=str(row.get("created_at") or ""),
+    return TestResultDTO.from_row(
+        {
+            "run_id": str(row.get("run_id") or ""),
+            "test_id": str(row.get("test_id") or ""),
+            "status": str(row.get("status") or ""),
+            "duration_ms": int(row.get("duration_ms") or 0),
+            "error_fingerprint": str(row.get("error_fingerprint") or ""),
+            "error_message": str(row.get("error_message") or ""),
+            "artifact_refs": tuple(str(item) for item in refs if str(item).strip()),
+            "stdout_ref": str(row.get("stdout_ref") or ""),
+            "stderr_ref": str(row.get("stderr_ref") or ""),
+            "created_at": str(row.get("created_at") or ""),
+        }
     )
 
 
@@ -338,25 +342,27 @@ def _to_test_history_dto(row: dict[str, Any], run: dict[str, Any] | None) -> Tes
     if not isinstance(refs, list):
         refs = []
     run_row = run or {}
-    return TestResultHistoryDTO(
-        run_id=str(row.get("run_id") or ""),
-        test_id=str(row.get("test_id") or ""),
-        status=str(row.get("status") or ""),
-        duration_ms=int(row.get("duration_ms") or 0),
-        error_fingerprint=str(row.get("error_fingerprint") or ""),
-        error_message=str(row.get("error_message") or ""),
-        artifact_refs=[str(item) for item in refs if str(item).strip()],
-        stdout_ref=str(row.get("stdout_ref") or ""),
-        stderr_ref=str(row.get("stderr_ref") or ""),
-        created_at=str(row.get("created_at") or ""),
-        run_timestamp=str(run_row.get("timestamp") or row.get("run_timestamp") or ""),
-        git_sha=str(run_row.get("git_sha") or row.get("run_git_sha") or row.get("git_sha") or ""),
-        agent_session_id=str(
-            run_row.get("agent_session_id")
-            or row.get("run_agent_session_id")
-            or row.get("agent_session_id")
-            or ""
-        ),
+    return TestResultHistoryDTO.from_row(
+        {
+            "run_id": str(row.get("run_id") or ""),
+            "test_id": str(row.get("test_id") or ""),
+            "status": str(row.get("status") or ""),
+            "duration_ms": int(row.get("duration_ms") or 0),
+            "error_fingerprint": str(row.get("error_fingerprint") or ""),
+            "error_message": str(row.get("error_message") or ""),
+            "artifact_refs": tuple(str(item) for item in refs if str(item).strip()),
+            "stdout_ref": str(row.get("stdout_ref") or ""),
+            "stderr_ref": str(row.get("stderr_ref") or ""),
+            "created_at": str(row.get("created_at") or ""),
+            "run_timestamp": str(run_row.get("timestamp") or row.get("run_timestamp") or ""),
+            "git_sha": str(run_row.get("git_sha") or row.get("run_git_sha") or row.get("git_sha") or ""),
+            "agent_session_id": str(
+                run_row.get("agent_session_id")
+                or row.get("run_agent_session_id")
+                or row.get("agent_session_id")
+                or ""
+            ),
+        }
     )
 
 
@@ -364,16 +370,18 @@ def _to_test_definition_dto(row: dict[str, Any]) -> TestDefinitionDTO:
     tags = row.get("tags_json", [])
     if not isinstance(tags, list):
         tags = []
-    return TestDefinitionDTO(
-        test_id=str(row.get("test_id") or ""),
-        project_id=str(row.get("project_id") or ""),
-        path=str(row.get("path") or ""),
-        name=str(row.get("name") or ""),
-        framework=str(row.get("framework") or "pytest"),
-        tags=[str(item) for item in tags if str(item).strip()],
-        owner=str(row.get("owner") or ""),
-        created_at=str(row.get("created_at") or ""),
-        updated_at=str(row.get("updated_at") or ""),
+    return TestDefinitionDTO.from_row(
+        {
+            "test_id": str(row.get("test_id") or ""),
+            "project_id": str(row.get("project_id") or ""),
+            "path": str(row.get("path") or ""),
+            "name": str(row.get("name") or ""),
+            "framework": str(row.get("framework") or "pytest"),
+            "tags": [str(item) for item in tags if str(item).strip()],
+            "owner": str(row.get("owner") or ""),
+            "created_at": str(row.get("created_at") or ""),
+            "updated_at": str(row.get("updated_at") or ""),
+        }
     )
 
 
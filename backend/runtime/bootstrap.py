@@ -144,6 +144,9 @@ def build_runtime_app(profile: RuntimeProfile | RuntimeProfileName) -> FastAPI:
         yield
         await container.shutdown(app)
 
+    # No default_response_class on purpose: with a response_model set, FastAPI
+    # (>=0.130) serializes straight to JSON bytes through pydantic-core, which
+    # a custom class such as ORJSONResponse would disable.
     app = FastAPI(
         title="CCDash API",
         description="Backend API for the CCDash agentic analytics dashboard",
@@ -17,7 +17,7 @@ from backend.db.factory import (
     get_test_result_repository,
     get_test_run_repository,
 )
-from backend.models import TestIntegritySignalDTO
+from backend.models import IntegritySignalDetails, TestIntegritySignalDTO
 
 
 logger = logging.getLogger("ccdash.test_visualizer.integrity")
@@ -211,7 +211,7 @@ class IntegrityDetector:
         file_path: str,
         test_ids: list[str],
         agent_session_id: str,
-        details: dict[str, Any],
+        details: IntegritySignalDetails,
     ) -> list[TestIntegritySignalDTO]:
         targets = test_ids or [""]
         rows: list[TestIntegritySignalDTO] = []
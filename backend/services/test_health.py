@@ -1,7 +1,7 @@
 """Service layer for Test Visualizer health, timeline, and correlation endpoints."""
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -39,23 +39,25 @@ def _parse_iso(value: str | None) -> datetime | None:
 
 
 def _to_dto_run(row: dict[str, Any]) -> TestRunDTO:
-    return TestRunDTO(
-        run_id=str(row.get("run_id") or ""),
-        project_id=str(row.get("project_id") or ""),
-        timestamp=str(row.get("timestamp") or ""),
-        git_sha=str(row.get("git_sha") or ""),
-        branch=str(row.get("branch") or ""),
-        agent_session_id=str(row.get("agent_session_id") or ""),
-        env_fingerprint=str(row.get("env_fingerprint") or ""),
-        trigger=str(row.get("trigger") or "local"),
-        status=str(row.get("status") or "complete"),
-        total_tests=int(row.get("total_tests") or 0),
-        passed_tests=int(row.get("passed_tests") or 0),
-        failed_tests=int(row.get("failed_tests") or 0),
-        skipped_tests=int(row.get("skipped_tests") or 0),
-        duration_ms=int(row.get("duration_ms") or 0),
-        metadata=row.get("metadata_json", {}) if isinstance(row.get("metadata_json", {}), dict) else {},
-        created_at=str(row.get("created_at") or ""),
+    return TestRunDTO.from_row(
+        {
+            "run_id": str(row.get("run_id") or ""),
+            "project_id": str(row.get("project_id") or ""),
+            "timestamp": str(row.get("timestamp") or ""),
+            "git_sha": str(row.get("git_sha") or ""),
+            "branch": str(row.get("branch") or ""),
+            "agent_session_id": str(row.get("agent_session_id") or ""),
+            "env_fingerprint": str(row.get("env_fingerprint") or ""),
+            "trigger": str(row.get("trigger") or "local"),
+            "status": str(row.get("status") or "complete"),
+            "total_tests": int(row.get("total_tests") or 0),
+            "passed_tests": int(row.get("passed_tests") or 0),
+            "failed_tests": int(row.get("failed_tests") or 0),
+            "skipped_tests": int(row.get("skipped_tests") or 0),
+            "duration_ms": int(row.get("duration_ms") or 0),
+            "metadata": row.get("metadata_json", {}) if isinstance(row.get("metadata_json", {}), dict) else {},
+            "created_at": str(row.get("created_at") or ""),
+        }
     )
 
 
@@ -80,17 +82,19 @@ def _to_dto_signal(row: dict[str, Any]) -> TestIntegritySignalDTO:
 
 
 def _status_totals(rows: list[dict[str, Any]]) -> tuple[int, int, int, int]:
+    # Tally raw status values first so normalisation runs once per distinct
+    # status instead of once per result row.
     passed = 0
     failed = 0
     skipped = 0
-    for row in rows:
-        status = str(row.get("status") or "").strip().lower()
+    for raw_status, count in Counter(row.get("status") for row in rows).items():
+        status = str(raw_status or "").strip().lower()
         if status in _FAILED_STATUSES:
-            failed += 1
+            failed += count
         elif status in _SKIPPED_STATUSES:
-            skipped += 1
+            skipped += count
         else:
-            passed += 1
+            passed += count
     total = passed + failed + skipped
     return total, passed, failed, skipped
 
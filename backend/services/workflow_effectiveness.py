@@ -781,14 +781,11 @@ async def _collect_effectiveness_dataset(
     baseline_durations = [_safe_float(row.get("duration_seconds"), 0.0) for row in filtered_sessions]
     baseline_tokens = [_session_workload_tokens(row) for row in filtered_sessions]
     baseline_costs = [_safe_float(row.get("total_cost"), 0.0) for row in filtered_sessions]
-    baseline_queue = [
-        _queue_operation_count(_safe_dict(row.get("session_forensics_json")))
-        for row in filtered_sessions
-    ]
-    baseline_subagents = [
-        _subagent_start_count(_safe_dict(row.get("session_forensics_json")))
-        for row in filtered_sessions
-    ]
+    # session_forensics_json is a large blob; decode it once per session and
+    # reuse it for the baselines and the per-session scoring below.
+    forensics_by_row = [_safe_dict(row.get("session_forensics_json")) for row in filtered_sessions]
+    baseline_queue = [_queue_operation_count(forensics) for forensics in forensics_by_row]
+    baseline_subagents = [_subagent_start_count(forensics) for forensics in forensics_by_row]
 
     duration_baseline = _median_or_zero(baseline_durations)
     token_baseline = _median_or_zero(baseline_tokens)
@@ -797,13 +794,12 @@ async def _collect_effectiveness_dataset(
     subagent_baseline = _median_or_zero([float(value) for value in baseline_subagents])
 
     dataset: list[dict[str, Any]] = []
-    for row in filtered_sessions:
+    for row, forensics in zip(filtered_sessions, forensics_by_row):
         session_id = str(row.get("id") or "")
         observation = observation_by_session.get(session_id)
         if not observation:
             continue
 
-        forensics = _safe_dict(row.get("session_forensics_json"))
         commands = [str(command) for command in _safe_list(_safe_dict(observation.get("evidence_json")).get("commands")) if str(command).strip()]
         workflow_ref = str(observation.get("workflow_ref") or "")
         feature_key = str(row.get("task_id") or observation.get("feature_id") or "").strip()
@@ -181,6 +181,24 @@ class DocumentFeatureSurfaceSnapshotTests(unittest.TestCase):
             },
         )
 
+    def test_document_raw_frontmatter_only_loaded_for_detail_reads(self) -> None:
+        row = {
+            "id": "DOC-raw",
+            "title": "Raw",
+            "file_path": "docs/project_plans/raw.md",
+            "canonical_path": "docs/project_plans/raw.md",
+            "frontmatter_json": json.dumps({"tags": ["x"], "raw": {"title": "Raw", "owner": "alice"}}),
+            "metadata_json": "{}",
+        }
+
+        listed = _map_document_row_to_model(row, include_content=False)
+        detailed = _map_document_row_to_model(row, include_content=True)
+
+        self.assertIsNone(listed.frontmatter.raw)
+        self.assertEqual(listed.frontmatter.raw_fields(), {})
+        self.assertEqual(detailed.frontmatter.raw, {"title": "Raw", "owner": "alice"})
+        self.assertNotIn("alice", repr(detailed.frontmatter))
+
     def test_feature_surface_snapshot_normalizes_primary_docs_coverage_and_quality(self) -> None:
         primary = _normalize_primary_documents(
             {
@@ -1,11 +1,61 @@
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
-from backend.parsers.documents import parse_document_file
+from backend.parsers import documents as documents_parser
+from backend.parsers.documents import _extract_frontmatter, parse_document_file, scan_documents
 
 
 class DocumentParserTests(unittest.TestCase):
+    def test_extract_frontmatter_handles_documents_without_frontmatter(self) -> None:
+        self.assertEqual(_extract_frontmatter("# Title\n---\nx: 1\n---\n"), ({}, "# Title\n---\nx: 1\n---\n", False))
+        self.assertEqual(_extract_frontmatter("---\ntitle: A\n---\nBody"), ({"title": "A"}, "Body", True))
+        self.assertEqual(_extract_frontmatter("---\ntitle: A\n---\nBody", max_body=2), ({"title": "A"}, "Bo", True))
+
+    def test_scan_documents_returns_visible_files_in_path_order(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "a").mkdir()
+            (root / "a-b").mkdir()
+            (root / "a-b" / "x.md").write_text("---\ntitle: AB\n---\nBody", encoding="utf-8")
+            (root / "a" / "x.md").write_text("---\ntitle: A\n---\nBody", encoding="utf-8")
+            (root / ".hidden.md").write_text("# Hidden", encoding="utf-8")
+
+            docs = scan_documents(root)
+
+            self.assertEqual([doc.title for doc in docs], ["A", "AB"])
+
+    def test_read_document_matches_full_read_for_large_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            cases = {
+                "long-body.md": "---\ntitle: Long\n---\n" + "\u8a9e" * 100_000,
+                "long-frontmatter.md": "---\n" + "".join(f"k{i}: {'e' * 60}\n" for i in range(2000)) + "---\nBody",
+                "no-frontmatter.md": "# Plain\n" + "x" * 100_000,
+            }
+            for name, text in cases.items():
+                path = root / name
+                path.write_text(text, encoding="utf-8")
+                fm, body, had_frontmatter = documents_parser._read_document(path)
+                expected_fm, expected_body, expected_had = _extract_frontmatter(text)
+                self.assertEqual(fm, expected_fm, name)
+                self.assertEqual(had_frontmatter, expected_had, name)
+                self.assertEqual(body[:5000], expected_body[:5000], name)
+
+    def test_date_fields_skip_filesystem_stat_when_dates_are_known(self) -> None:
+        fm = {"created": "2024-01-01", "updated": "2024-02-01"}
+        git_index = {"doc.md": {"createdAt": "2024-01-05T00:00:00Z", "updatedAt": "2024-02-05T00:00:00Z"}}
+        with patch.object(documents_parser, "file_metadata_dates", return_value={}) as stat_dates:
+            documents_parser._build_document_date_fields_with_git(
+                Path("doc.md"), fm, "active", "doc.md", git_index, set()
+            )
+            stat_dates.assert_not_called()
+            documents_parser._build_document_date_fields_with_git(
+                Path("doc.md"), fm, "active", "doc.md", git_index, {"doc.md"}
+            )
+            stat_dates.assert_called_once()
+
     def test_parse_progress_document_extracts_typed_metadata(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             root = Path(tmpdir)
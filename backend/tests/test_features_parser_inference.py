@@ -1,13 +1,17 @@
+import os
 import tempfile
+import time
 import unittest
 import warnings
 from pathlib import Path
+from unittest.mock import patch
 
 import yaml
 
 from backend import config
 from backend.models import EntityDates, TimelineEvent
-from backend.parsers.features import scan_features
+from backend.parsers import features as features_parser
+from backend.parsers.features import _read_frontmatter_cached, resolve_file_for_feature, scan_features
 
 
 def _frontmatter_status(path: Path) -> str:
@@ -1055,5 +1059,82 @@ PRD body
             )
 
 
+    def test_frontmatter_cache_reparses_after_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "doc.md"
+            path.write_text("---\nstatus: draft\n---\nBody\n", encoding="utf-8")
+            self.assertEqual(_read_frontmatter_cached(path), {"status": "draft"})
+
+            # Same length, written within the same timestamp tick: no manual mtime bump.
+            path.write_text("---\nstatus: ready\n---\nBody\n", encoding="utf-8")
+            self.assertEqual(_read_frontmatter_cached(path), {"status": "ready"})
+
+    def test_frontmatter_cache_reuses_settled_files_until_they_change(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "doc.md"
+            path.write_text("---\nstatus: draft\n---\nBody\n", encoding="utf-8")
+            settled_ns = time.time_ns() - 60_000_000_000
+            os.utime(path, ns=(settled_ns, settled_ns))
+            first = _read_frontmatter_cached(path)
+            self.assertEqual(first, {"status": "draft"})
+            self.assertIs(_read_frontmatter_cached(path), first)
+
+            path.write_text("---\nstatus: completed\n---\nBody\n", encoding="utf-8")
+            self.assertEqual(_read_frontmatter_cached(path), {"status": "completed"})
+
+    def test_frontmatter_cache_reads_frontmatter_longer_than_read_window(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "doc.md"
+            summary = "x" * 40_000
+            path.write_text(f"---\nsummary: {summary}\nstatus: review\n---\nBody\n", encoding="utf-8")
+            self.assertEqual(_read_frontmatter_cached(path), {"summary": summary, "status": "review"})
+
+    def test_resolve_file_for_feature_tracks_added_and_removed_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            docs_dir = Path(tmpdir) / "docs"
+            prd_dir = docs_dir / "PRDs" / "features"
+            prd_dir.mkdir(parents=True)
+            v1 = prd_dir / "feature-r-v1.md"
+            v1.write_text("# v1\n", encoding="utf-8")
+            progress_dir = Path(tmpdir) / "progress"
+
+            self.assertEqual(resolve_file_for_feature("feature-r-v2", docs_dir, progress_dir), v1)
+
+            v2 = prd_dir / "feature-r-v2.md"
+            v2.write_text("# v2\n", encoding="utf-8")
+            self.assertEqual(resolve_file_for_feature("feature-r-v2", docs_dir, progress_dir), v2)
+            self.assertEqual(resolve_file_for_feature("feature-r-v1", docs_dir, progress_dir), v1)
+            v1.unlink()
+            self.assertEqual(resolve_file_for_feature("feature-r-v2", docs_dir, progress_dir), v2)
+            v2.unlink()
+            self.assertIsNone(resolve_file_for_feature("feature-r-v2", docs_dir, progress_dir))
+
+
+    def test_resolve_file_for_feature_reuses_index_while_tree_is_unchanged(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            docs_dir = Path(tmpdir) / "docs"
+            prd_dir = docs_dir / "PRDs" / "features"
+            prd_dir.mkdir(parents=True)
+            v1 = prd_dir / "feature-s-v1.md"
+            v1.write_text("# v1\n", encoding="utf-8")
+            progress_dir = Path(tmpdir) / "progress"
+
+            def settle(age: float) -> None:
+                past = time.time() - age
+                for directory in (docs_dir / "PRDs", prd_dir):
+                    os.utime(directory, (past, past))
+
+            settle(60)
+            with patch.object(features_parser, "_sorted_markdown_paths", wraps=features_parser._sorted_markdown_paths) as sorted_paths:
+                self.assertEqual(resolve_file_for_feature("feature-s-v2", docs_dir, progress_dir), v1)
+                self.assertEqual(resolve_file_for_feature("feature-s-v1", docs_dir, progress_dir), v1)
+                self.assertEqual(sorted_paths.call_count, 1)
+
+                v2 = prd_dir / "feature-s-v2.md"
+                v2.write_text("# v2\n", encoding="utf-8")
+                settle(30)
+                self.assertEqual(resolve_file_for_feature("feature-s-v2", docs_dir, progress_dir), v2)
+                self.assertEqual(sorted_paths.call_count, 2)
+
 if __name__ == "__main__":
     unittest.main()
@@ -8,9 +8,25 @@ from backend.db.repositories.test_integrity import SqliteTestIntegrityRepository
 from backend.db.repositories.test_results import SqliteTestResultRepository
 from backend.db.repositories.test_runs import SqliteTestRunRepository
 from backend.db.sqlite_migrations import run_migrations
+from backend.models import TestIntegritySignalDTO
 from backend.services.integrity_detector import IntegrityDetector
 
 
+class TestIntegritySignalDetailsRoundTrip(unittest.TestCase):
+    def test_details_keep_unknown_keys_and_shapes(self) -> None:
+        details = {"reason": "r", "foo": 1, "removed_assertions": "not-a-list"}
+        dto = TestIntegritySignalDTO(
+            signal_id="sig-1",
+            project_id="project-1",
+            git_sha="abc",
+            file_path="tests/test_x.py",
+            signal_type="edited_before_green",
+            details=details,
+        )
+        restored = TestIntegritySignalDTO.model_validate(dto.model_dump())
+        self.assertEqual(restored.details, details)
+
+
 class TestIntegrityDetector(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self) -> None:
         self._prev_enabled = config.CCDASH_TEST_VISUALIZER_ENABLED
@@ -115,6 +131,9 @@ class TestIntegrityDetector(unittest.IsolatedAsyncioTestCase):
                 "xfail_added",
             ],
         )
+        details_by_type = {row.signal_type: row.details for row in rows}
+        self.assertEqual(set(details_by_type["skip_introduced"]), {"added_skip_lines"})
+        self.assertIn("reason", details_by_type["edited_before_green"])
 
         stored = await self.integrity_repo.list_by_project("project-1", limit=50, offset=0)
         self.assertGreaterEqual(len(stored), 5)
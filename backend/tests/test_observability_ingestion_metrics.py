@@ -1,5 +1,8 @@
+import os
+import sys
 import tempfile
 import unittest
+from collections import deque
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
@@ -118,6 +121,235 @@ class IngestionObservabilityTests(unittest.TestCase):
         self.assertEqual(prom_hist.labels_calls, [expected_prom_labels])
         self.assertEqual(prom_hist.observe_calls, [0.0])
 
+    def test_record_token_cost_labels_each_direction_for_prometheus(self) -> None:
+        prom_tokens = _FakePromCounter()
+        prom_cost = _FakePromCounter()
+
+        with (
+            patch.object(otel, "_enabled", False),
+            patch.object(otel, "_prom_enabled", True),
+            patch.object(otel, "_prom_tokens_counter", prom_tokens),
+            patch.object(otel, "_prom_cost_counter", prom_cost),
+        ):
+            otel.record_token_cost(
+                project_id="project-1",
+                model="claude-sonnet",
+                feature_id="",
+                token_input=10,
+                token_output=4,
+                cost_usd=0.5,
+            )
+
+        base = {"project": "project-1", "model": "claude-sonnet", "feature": "none"}
+        self.assertEqual(prom_cost.labels_calls, [base])
+        self.assertEqual(
+            prom_tokens.labels_calls,
+            [{**base, "direction": "input"}, {**base, "direction": "output"}],
+        )
+        self.assertEqual(prom_tokens.inc_calls, [10, 4])
+
+    def test_record_token_cost_reuses_otel_label_dicts(self) -> None:
+        otel_tokens = _FakeCounter()
+
+        with (
+            patch.object(otel, "_enabled", True),
+            patch.object(otel, "_prom_enabled", False),
+            patch.object(otel, "_tokens_counter", otel_tokens),
+            patch.object(otel, "_cost_counter", None),
+        ):
+            for _ in range(2):
+                otel.record_token_cost(
+                    project_id="project-1",
+                    model="claude-sonnet",
+                    feature_id="F-1",
+                    token_input=10,
+                    token_output=4,
+                    cost_usd=0.0,
+                )
+
+        self.assertEqual([value for value, _ in otel_tokens.calls], [10, 4, 10, 4])
+        self.assertEqual(otel_tokens.calls[0][1]["direction"], "input")
+        self.assertEqual(otel_tokens.calls[1][1]["direction"], "output")
+        self.assertIs(otel_tokens.calls[0][1], otel_tokens.calls[2][1])
+
+    def test_record_ingestion_reuses_bound_prometheus_child(self) -> None:
+        prom_counter = _FakePromCounter()
+
+        with (
+            patch.object(otel, "_enabled", False),
+            patch.object(otel, "_prom_enabled", True),
+            patch.object(otel, "_prom_ingestion_counter", prom_counter),
+            patch.object(otel, "_prom_ingestion_latency_hist", None),
+        ):
+            for _ in range(3):
+                otel.record_ingestion("session", "success", 1.0, project_id="project-1", source="jsonl")
+
+        self.assertEqual(len(prom_counter.labels_calls), 1)
+        self.assertEqual(prom_counter.inc_calls, [1, 1, 1])
+
+    def test_record_helpers_are_noops_when_telemetry_disabled(self) -> None:
+        otel_counter = _FakeCounter()
+
+        with (
+            patch.object(otel, "_enabled", False),
+            patch.object(otel, "_prom_enabled", False),
+            patch.object(otel, "_ingestion_counter", otel_counter),
+            patch.object(otel, "_parser_failure_counter", otel_counter),
+            patch.object(otel, "_tool_calls_counter", otel_counter),
+        ):
+            otel.record_ingestion("session", "success", 1.0, project_id="project-1")
+            otel.record_parser_failure("claude_code", project_id="project-1")
+            otel.record_tool_result("Bash", "success", project_id="project-1")
+
+        self.assertEqual(otel_counter.calls, [])
+
+    def test_record_ingestion_falls_back_to_unknown_labels(self) -> None:
+        otel_counter = _FakeCounter()
+
+        with (
+            patch.object(otel, "_enabled", True),
+            patch.object(otel, "_prom_enabled", False),
+            patch.object(otel, "_ingestion_counter", otel_counter),
+            patch.object(otel, "_ingestion_latency_hist", None),
+        ):
+            otel.record_ingestion("session", "", 1.0, project_id="project-1")
+
+        labels = otel_counter.calls[0][1]
+        self.assertEqual(labels["entity"], "session")
+        self.assertEqual(labels["result"], "unknown")
+        self.assertEqual(labels["source"], "unknown")
+
+    def test_deferred_recording_applies_updates_on_drain(self) -> None:
+        otel_counter = _FakeCounter()
+
+        with (
+            patch.object(otel, "_enabled", True),
+            patch.object(otel, "_prom_enabled", False),
+            patch.object(otel, "_ingestion_counter", otel_counter),
+            patch.object(otel, "_ingestion_latency_hist", None),
+            patch.object(otel, "_record_queue", deque(maxlen=2)),
+            patch.object(otel, "_record_queue_dropped", 0),
+        ):
+            for _ in range(3):
+                otel.record_ingestion("session", "success", 1.0, project_id="project-1")
+            self.assertEqual(otel_counter.calls, [])
+            self.assertEqual(otel._record_queue_dropped, 1)
+
+            self.assertEqual(otel._drain_record_queue(), 2)
+
+        self.assertEqual(len(otel_counter.calls), 2)
+
+    def test_prometheus_project_label_is_capped(self) -> None:
+        with (
+            patch.object(otel.config, "PROM_MAX_PROJECTS", 2),
+            patch.object(otel, "_prom_seen_projects", set()),
+        ):
+            labels = [otel._prom_labels(project_id=pid)["project"] for pid in ("p1", "p2", "p3", "p1")]
+
+        self.assertEqual(labels, ["p1", "p2", "other", "p1"])
+
+    def test_prometheus_specs_target_declared_globals(self) -> None:
+        names = [spec[2] for spec in otel._PROM_SPECS]
+
+        self.assertEqual(len(names), len(set(names)))
+        for attr, kind, *_ in otel._PROM_SPECS:
+            self.assertTrue(hasattr(otel, f"_prom_{attr}"), attr)
+            self.assertIn(kind, {"counter", "gauge", "histogram"})
+        self.assertLessEqual(set(otel._PROM_SPEC_KWARGS), {spec[0] for spec in otel._PROM_SPECS})
+
+    def test_otlp_endpoint_normalizers_append_signal_path(self) -> None:
+        cases = {
+            "": "",
+            "http://collector:4318": "http://collector:4318/v1/traces",
+            "http://collector:4318/": "http://collector:4318/v1/traces",
+            "http://collector:4318/v1": "http://collector:4318/v1/traces",
+            "http://collector:4318/v1/": "http://collector:4318/v1/traces",
+            "http://collector:4318/v1/traces": "http://collector:4318/v1/traces",
+        }
+        for base, expected in cases.items():
+            self.assertEqual(otel._otlp_traces_endpoint(base), expected, base)
+        self.assertEqual(otel._otlp_metrics_endpoint("http://collector:4318/v1"), "http://collector:4318/v1/metrics")
+
+    def test_grpc_protocol_falls_back_to_http_exporters_when_unavailable(self) -> None:
+        with (
+            patch.object(otel.config, "OTEL_PROTOCOL", "grpc"),
+            patch.object(otel.config, "OTEL_ENDPOINT", "http://collector:4318"),
+            patch.dict(sys.modules, {"grpc": None}),
+        ):
+            span_exporter, metric_exporter = otel._build_otlp_exporters()
+
+        self.assertIn(".proto.http.", type(span_exporter).__module__)
+        self.assertIn(".proto.http.", type(metric_exporter).__module__)
+
+    def test_shared_otlp_http_session_defers_to_credential_provider(self) -> None:
+        with patch.dict("os.environ", {}, clear=False):
+            for name in otel._OTLP_HTTP_CREDENTIAL_ENV_VARS:
+                os.environ.pop(name, None)
+            self.assertIsNotNone(otel._shared_otlp_http_session())
+            os.environ["OTEL_PYTHON_EXPORTER_OTLP_HTTP_CREDENTIAL_PROVIDER"] = "pkg:provider"
+            self.assertIsNone(otel._shared_otlp_http_session())
+
+
+class StartSpanTests(unittest.TestCase):
+    def test_disabled_start_span_returns_shared_noop_context(self) -> None:
+        with patch.object(otel, "_enabled", False):
+            first = otel.start_span("a")
+            second = otel.start_span("b", {"k": "v"})
+            with first as span:
+                self.assertIsNone(span)
+
+        self.assertIs(first, second)
+
+    def test_enabled_start_span_sets_attributes_and_records_errors(self) -> None:
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+        with (
+            patch.object(otel, "_enabled", True),
+            patch.object(otel, "_tracer", provider.get_tracer("test")),
+        ):
+            with otel.start_span("ok", {"ccdash.key": "v", "ccdash.none": None}) as span:
+                self.assertIsNotNone(span)
+            with self.assertRaises(ValueError):
+                with otel.start_span("boom"):
+                    raise ValueError("x")
+
+        finished = {item.name: item for item in exporter.get_finished_spans()}
+        self.assertEqual(finished["ok"].attributes["ccdash.key"], "v")
+        self.assertNotIn("ccdash.none", finished["ok"].attributes)
+        self.assertEqual(finished["boom"].status.status_code.name, "ERROR")
+
+
+class CircuitBreakerSpanExporterTests(unittest.TestCase):
+    def test_breaker_opens_after_consecutive_failures_and_resets_on_success(self) -> None:
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        inner = SimpleNamespace(calls=0, result=SpanExportResult.FAILURE)
+
+        def export(spans):
+            inner.calls += 1
+            return inner.result
+
+        inner.export = export
+        exporter = otel._CircuitBreakerSpanExporter(inner, threshold=2, cooldown_s=30)
+
+        with patch.object(otel.time, "monotonic", return_value=100.0):
+            self.assertEqual(exporter.export(["a"]), SpanExportResult.FAILURE)
+            self.assertEqual(exporter.export(["a"]), SpanExportResult.FAILURE)
+            self.assertEqual(exporter.export(["a", "b"]), SpanExportResult.SUCCESS)
+        self.assertEqual(inner.calls, 2)
+        self.assertEqual(exporter.dropped_spans, 2)
+
+        inner.result = SpanExportResult.SUCCESS
+        with patch.object(otel.time, "monotonic", return_value=131.0):
+            self.assertEqual(exporter.export(["a"]), SpanExportResult.SUCCESS)
+        self.assertEqual(inner.calls, 3)
+
 
 class JsonlSessionSyncIngestionMetricTests(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self) -> None:
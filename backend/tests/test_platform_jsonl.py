@@ -0,0 +1,21 @@
+import math
+import unittest
+
+from backend.parsers.platforms.jsonl import decode_jsonl_lines
+
+
+class DecodeJsonlLinesTests(unittest.TestCase):
+    def test_skips_blank_and_malformed_lines(self) -> None:
+        entries = decode_jsonl_lines(['{"a": 1}', "", "   ", "{not json", '  {"b": [2]}  '])
+
+        self.assertEqual(entries, [{"a": 1}, {"b": [2]}])
+
+    def test_accepts_stdlib_only_literals(self) -> None:
+        entries = decode_jsonl_lines(['{"v": NaN}', '{"big": 123456789012345678901234567890}'])
+
+        self.assertTrue(math.isnan(entries[0]["v"]))
+        self.assertEqual(entries[1]["big"], 123456789012345678901234567890)
+
+
+if __name__ == "__main__":
+    unittest.main()
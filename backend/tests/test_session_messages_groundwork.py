@@ -283,6 +283,16 @@ class CanonicalPayloadProvenanceTests(unittest.TestCase):
         payload = svc._legacy_log_payload(row)
         self.assertIsNone(payload["toolCall"])
 
+    def test_legacy_payload_interns_speaker_and_type(self) -> None:
+        svc = self._svc()
+        rows = [
+            {"source_log_id": f"log-{i}", "speaker": "".join(["us", "er"]), "type": "".join(["mess", "age"])}
+            for i in range(2)
+        ]
+        first, second = (svc._legacy_log_payload(row) for row in rows)
+        self.assertIs(first["speaker"], second["speaker"])
+        self.assertIs(first["type"], second["type"])
+
 
 class ProjectSessionMessagesProjectionTests(unittest.TestCase):
     def test_projects_lineage_fields_from_session_row(self) -> None:
@@ -217,7 +217,7 @@ class _FakeRepo:
 
 
 class _FakeSessionDetailRepo:
-    async def get_by_id(self, session_id):
+    async def get_by_id(self, session_id, **_kwargs):
         if session_id == "S-main":
             return {"id": session_id}
         return None
@@ -6,7 +6,7 @@ from backend import config
 from backend.db.repositories.features import SqliteFeatureRepository
 from backend.db.repositories.sessions import SqliteSessionRepository
 from backend.db.sqlite_migrations import run_migrations
-from backend.services.test_health import TestHealthService
+from backend.services.test_health import TestHealthService, _status_totals
 
 
 class TestHealthServiceTests(unittest.IsolatedAsyncioTestCase):
@@ -145,5 +145,18 @@ class TestHealthServiceTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(len(correlation.integrity_signals), 1)
 
 
+class StatusTotalsTests(unittest.TestCase):
+    def test_normalizes_each_distinct_status(self) -> None:
+        rows = [
+            {"status": "passed"},
+            {"status": "FAILED "},
+            {"status": "error"},
+            {"status": "xfailed"},
+            {"status": None},
+            {},
+        ]
+        self.assertEqual(_status_totals(rows), (6, 3, 2, 1))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -600,5 +600,38 @@ class TestVisualizerRouterTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(ctx.exception.status_code, 503)
 
 
+class TestVisualizerRowMapperTests(unittest.TestCase):
+    def test_row_mappers_match_validated_construction(self) -> None:
+        row = {
+            "run_id": "run-1",
+            "test_id": "test-1",
+            "project_id": "project-1",
+            "timestamp": "2026-03-01T00:00:00Z",
+            "status": "passed",
+            "duration_ms": "12",
+            "total_tests": 3,
+            "artifact_refs_json": ["a.log", " "],
+            "metadata_json": {"ci": True},
+            "tags_json": ["unit"],
+            "path": "tests/test_x.py",
+            "name": "test_x",
+        }
+
+        run = router._to_test_run_dto(row)
+        result = router._to_test_result_dto(row)
+        definition = router._to_test_definition_dto(row)
+
+        self.assertEqual(run.model_dump(), router.TestRunDTO(**run.model_dump()).model_dump())
+        self.assertEqual(result.duration_ms, 12)
+        self.assertEqual(result.artifact_refs, ("a.log",))
+        self.assertEqual(result.model_dump(), router.TestResultDTO(**result.model_dump()).model_dump())
+        self.assertEqual(definition.framework, "pytest")
+        self.assertEqual(definition.tags, ["unit"])
+
+        history = router._to_test_history_dto(row, {"timestamp": "2026-03-01T00:00:00Z", "git_sha": "abc"})
+        self.assertEqual(history.git_sha, "abc")
+        self.assertEqual(history.model_dump(), router.TestResultHistoryDTO(**history.model_dump()).model_dump())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env bash
+# build-pydantic-core-pgo.sh — Rebuild the installed pydantic-core with profile-guided optimisation.
+#
+# Usage (inside the image builder stage, with /opt/venv active and the repo at /app):
+#   ./deploy/runtime/scripts/build-pydantic-core-pgo.sh
+#
+# Steps:
+#   1. download the sdist matching the pydantic-core version pydantic pinned
+#   2. build and install an instrumented wheel (-Cprofile-generate)
+#   3. run pydantic_pgo_training.py to record a profile of CCDash's models
+#   4. merge the profile and reinstall an optimised wheel (-Cprofile-use)
+#
+# Requires curl and a C toolchain; rustup is installed on demand.
+set -euo pipefail
+
+APP_DIR="${CCDASH_APP_DIR:-/app}"
+WORK_DIR="$(mktemp -d)"
+PROFILE_DIR="${WORK_DIR}/profiles"
+trap 'rm -rf "${WORK_DIR}"' EXIT
+
+info() { echo "[pgo] $*"; }
+
+if ! command -v cargo >/dev/null 2>&1; then
+  info "installing rust toolchain"
+  curl --proto '=https' --tlsv1.2 -sSf https://sh.rustup.rs | sh -s -- -y --profile minimal
+  # shellcheck disable=SC1091
+  source "${HOME}/.cargo/env"
+fi
+rustup component add llvm-tools-preview
+
+HOST_TRIPLE="$(rustc -vV | sed -n 's/^host: //p')"
+LLVM_PROFDATA="$(rustc --print sysroot)/lib/rustlib/${HOST_TRIPLE}/bin/llvm-profdata"
+
+CORE_VERSION="$(python -c 'import pydantic_core; print(pydantic_core.__version__)')"
+info "pydantic-core ${CORE_VERSION}"
+
+python -m pip install maturin
+python -m pip download --no-deps --no-binary :all: --dest "${WORK_DIR}" "pydantic-core==${CORE_VERSION}"
+tar -xzf "${WORK_DIR}"/pydantic_core-*.tar.gz -C "${WORK_DIR}"
+SRC_DIR="$(find "${WORK_DIR}" -maxdepth 1 -type d -name 'pydantic_core-*' | head -n 1)"
+
+build_and_install() {
+  local rustflags="$1"
+  rm -rf "${SRC_DIR}/target/wheels"
+  (cd "${SRC_DIR}" && RUSTFLAGS="${rustflags}" maturin build --release --out target/wheels)
+  python -m pip install --no-deps --force-reinstall "${SRC_DIR}"/target/wheels/*.whl
+}
+
+info "building instrumented wheel"
+build_and_install "-Cprofile-generate=${PROFILE_DIR}"
+
+info "running training workload"
+(cd "${APP_DIR}" && PYTHONPATH="${APP_DIR}" python deploy/runtime/scripts/pydantic_pgo_training.py)
+
+"${LLVM_PROFDATA}" merge -o "${WORK_DIR}/merged.profdata" "${PROFILE_DIR}"
+
+info "building optimised wheel"
+build_and_install "-Cprofile-use=${WORK_DIR}/merged.profdata -Cllvm-args=-pgo-warn-missing-function"
+
+python -c 'import pydantic_core; print("[pgo] installed pydantic-core", pydantic_core.__version__)'
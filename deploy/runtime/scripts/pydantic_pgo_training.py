@@ -0,0 +1,95 @@
+"""Training workload for the profile-guided pydantic-core build.
+
+Exercises the validation and serialization paths the API and worker hit most:
+session transcripts, paginated session lists and test-run ingest rows. Run by
+build-pydantic-core-pgo.sh against an instrumented pydantic-core; the profile
+it leaves behind drives the optimised rebuild.
+"""
+from __future__ import annotations
+
+from pydantic import TypeAdapter
+
+from backend.models import (
+    AgentSession,
+    PaginatedResponse,
+    SessionLog,
+    TestResultDTO,
+    TestRunDTO,
+)
+
+ROUNDS = 200
+
+
+def _session_payload(index: int) -> dict:
+    logs = []
+    for log_index in range(50):
+        log = {
+            "id": f"log-{log_index}",
+            "timestamp": f"2026-03-01T12:{log_index % 60:02d}:00Z",
+            "speaker": "agent" if log_index % 2 else "user",
+            "type": "tool" if log_index % 5 == 0 else "message",
+            "content": "Running the focused test suite before committing." * 3,
+            "metadata": {"model": "claude-sonnet", "inputTokens": 1200, "outputTokens": 340},
+        }
+        if log["type"] == "tool":
+            log["toolCall"] = {"id": f"call-{log_index}", "name": "Bash", "args": "pytest -q", "output": "ok"}
+        logs.append(log)
+    return {
+        "id": f"S-{index}",
+        "title": "Implement backlog item",
+        "taskId": f"FEAT-{index}",
+        "model": "claude-sonnet",
+        "durationSeconds": 420,
+        "tokensIn": 120_000,
+        "tokensOut": 18_000,
+        "totalCost": 1.25,
+        "startedAt": "2026-03-01T12:00:00Z",
+        "logs": logs,
+    }
+
+
+def _test_rows(run_id: str) -> tuple[dict, list[dict]]:
+    run = {
+        "run_id": run_id,
+        "project_id": "project-1",
+        "timestamp": "2026-03-01T12:00:00Z",
+        "git_sha": "abc123",
+        "total_tests": 100,
+        "passed_tests": 97,
+        "failed_tests": 2,
+        "skipped_tests": 1,
+        "duration_ms": 8200,
+        "metadata": {"ci": True},
+    }
+    results = [
+        {
+            "run_id": run_id,
+            "test_id": f"test-{index}",
+            "status": "failed" if index % 50 == 0 else "passed",
+            "duration_ms": index * 3,
+            "artifact_refs": [f"logs/{index}.txt"] if index % 10 == 0 else [],
+        }
+        for index in range(100)
+    ]
+    return run, results
+
+
+def main() -> None:
+    session_page = TypeAdapter(PaginatedResponse[AgentSession])
+    log_list = TypeAdapter(PaginatedResponse[SessionLog])
+    for round_index in range(ROUNDS):
+        sessions = [AgentSession.model_validate(_session_payload(index)) for index in range(10)]
+        page = PaginatedResponse[AgentSession](items=sessions, total=100, offset=0, limit=10)
+        session_page.validate_json(session_page.dump_json(page))
+        for session in sessions:
+            log_page = {"items": session.logs, "total": len(session.logs), "offset": 0, "limit": 50}
+            log_list.dump_json(log_list.validate_python(log_page))
+
+        run, results = _test_rows(f"run-{round_index}")
+        TestRunDTO.model_validate(run).model_dump_json()
+        for row in results:
+            TestResultDTO.model_validate(row).model_dump()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Optional native build hook for the CCDash backend.
+
+Package metadata lives in ``pyproject.toml``; this shim only exists so the
+pure-string hot paths in ``backend/model_identity.py`` can be compiled with
+mypyc when ``CCDASH_MYPYC=1`` is set at build time::
+
+    pip install mypy
+    CCDASH_MYPYC=1 pip install --no-build-isolation -e .
+
+mypy is not a build requirement, so an isolated build cannot see it; setting
+the flag without mypyc importable fails the build instead of silently skipping
+compilation. Without the flag the package installs as plain Python and the
+``.py`` module is imported unchanged.
+"""
+from __future__ import annotations
+
+import os
+
+from setuptools import setup
+
+_MYPYC_MODULES = ["backend/model_identity.py"]
+
+
+def _ext_modules() -> list:
+    if os.environ.get("CCDASH_MYPYC", "").strip().lower() not in {"1", "true", "yes", "on"}:
+        return []
+    try:
+        from mypyc.build import mypycify
+    except ImportError as exc:
+        raise RuntimeError(
+            "CCDASH_MYPYC is set but mypyc is not importable; install mypy and build with "
+            "--no-build-isolation, or unset CCDASH_MYPYC"
+        ) from exc
+    return mypycify(_MYPYC_MODULES, opt_level="3")
+
+
+setup(ext_modules=_ext_modules())
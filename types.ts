@@ -1288,7 +1288,7 @@ export interface PlanDocument {
     contextFiles?: string[];
     integritySignalRefs?: string[];
     fieldKeys?: string[];
-    raw?: Record<string, any>;
+    raw?: Record<string, any> | null;
   };
   category?: string;
   pathSegments?: string[];